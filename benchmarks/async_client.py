@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+
+from eth_abi import decode_single, encode_single
+from eth_account import Account
+from loguru import logger
+
+from benchmarks.stub_rpc import StubRPCServer
+from config.contracts_addresses import honey_address, usdc_address, wbear_address
+from services import encoder
+from services.async_berachain import AsyncBeraChain
+from services.executor import AsyncWalletExecutor
+from services.wallets import WalletRegistry
+
+PREVIEW_SWAP_EXACT, PREVIEW_TYPES = encoder.function(
+    "getPreviewSwapExact(uint8,address,address,uint256,address)"
+)
+
+ROUTES = {
+    "bera_name": lambda bera: bera.create_bera_name,
+    "honey_jar": lambda bera: bera.honey_jar_mint,
+    "borrow_bend": lambda bera: lambda wallet: bera.bend_borrow(wallet, 10**18, honey_address),
+    "swap": lambda bera: lambda wallet: bera.bex_swap(
+        wallet, wbear_address, usdc_address, 10**15, bera.faker
+    ),
+}
+
+
+class QuotingStub(StubRPCServer):
+    def result(self, method, params):
+        data = params[0].get("data", "") if method == "eth_call" else ""
+        if data.startswith("0x" + PREVIEW_SWAP_EXACT.hex()):
+            _, _, _, amount, quote_asset = decode_single(PREVIEW_TYPES, bytes.fromhex(data[10:]))
+            return "0x" + encode_single("(address,uint256)", (quote_asset, amount * 2)).hex()
+        return super().result(method, params)
+
+
+async def run(name, stubs, wallets, fee_mode, concurrency, directory):
+    async with AsyncBeraChain(
+        [stub.url for stub in stubs], connection_limit=concurrency, cache_dir=directory
+    ) as bera:
+        bera.gas_oracle.mode = fee_mode
+        bera.faker.name()
+        for stub in stubs:
+            stub.http_requests = 0
+            stub.rpc_calls = 0
+            stub.calls_by_method = {}
+        started = time.perf_counter()
+        results = await AsyncWalletExecutor(concurrency).run(ROUTES[name](bera), wallets)
+        elapsed = time.perf_counter() - started
+        router_requests = bera.quoter.router_requests
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert not errors, errors[:3]
+        receipts = await asyncio.get_running_loop().run_in_executor(
+            None, bera.receipts.wait_all, results
+        )
+    assert all(receipt["status"] == 1 for receipt in receipts), receipts[:3]
+    calls = {}
+    for stub in stubs:
+        for method, count in stub.calls_by_method.items():
+            calls[method] = calls.get(method, 0) + count
+    print(
+        f"{name:<12} {fee_mode:<8} {len(wallets)} wallets in {elapsed:.2f}s "
+        f"({len(wallets) / elapsed:.0f} wallets/s, {router_requests} router requests, "
+        f"{sum(stub.rpc_calls for stub in stubs)} RPC calls: "
+        + ", ".join(f"{method}={count}" for method, count in sorted(calls.items()))
+        + ")"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wallets", type=int, default=200)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.05, 0.05])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--routes", nargs="+", choices=list(ROUTES), default=list(ROUTES))
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    wallets = list(WalletRegistry([Account.create().key.hex() for _ in range(args.wallets)]))
+    stubs = [QuotingStub(latency=latency).start() for latency in args.latency]
+    for stub in stubs[1:]:
+        stub.sent = stubs[0].sent
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for name in args.routes:
+                for fee_mode in ("legacy", "eip1559"):
+                    asyncio.run(
+                        run(name, stubs, wallets, fee_mode, args.concurrency, directory)
+                    )
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
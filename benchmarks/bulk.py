@@ -0,0 +1,52 @@
+import argparse
+import tempfile
+import time
+
+from eth_account import Account
+
+from benchmarks.stub_rpc import StubRPCServer
+from services.berachain import BeraChain
+from services.executor import WalletExecutor
+from services.wallets import WalletRegistry
+
+
+def per_wallet(bera, wallets):
+    return WalletExecutor().run(
+        lambda wallet: bera.receipts.wait(bera.create_bera_name(wallet)), wallets
+    )
+
+
+def bulk(bera, wallets):
+    return bera.receipts.wait_all(bera.bulk_create_bera_name(wallets))
+
+
+def run(name, stub, route, wallets, directory):
+    bera = BeraChain([stub.url], cache_dir=directory, metrics_path="")
+    bera.faker.name()
+    stub.http_requests = 0
+    stub.rpc_calls = 0
+    started = time.perf_counter()
+    receipts = route(bera, wallets)
+    elapsed = time.perf_counter() - started
+    assert all(receipt["status"] == 1 for receipt in receipts), receipts
+    print(
+        f"{name:<12} {len(wallets)} wallets in {elapsed:.2f}s "
+        f"({len(wallets) / elapsed:.0f} wallets/s, {stub.http_requests} HTTP requests, "
+        f"{stub.rpc_calls} RPC calls)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wallets", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    wallets = list(WalletRegistry([Account.create().key.hex() for _ in range(args.wallets)]))
+    with StubRPCServer(latency=args.latency) as stub, tempfile.TemporaryDirectory() as directory:
+        run("per wallet", stub, per_wallet, wallets, directory)
+        run("bulk", stub, bulk, wallets, directory)
+
+
+if __name__ == "__main__":
+    main()
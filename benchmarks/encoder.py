@@ -0,0 +1,111 @@
+import argparse
+import time
+
+from web3 import Web3
+
+from benchmarks.stub_rpc import StubRPCServer
+from config.abi import bex_abi, erc_20_abi, honey_abi, bend_abi, bera_name_abi
+from config.contracts_addresses import (
+    bex_swap_address,
+    usdc_address,
+    honey_swap_address,
+    bend_address,
+    bera_name_address,
+    usdc_pool_address,
+    wbear_address,
+    zero_address,
+)
+from services import encoder
+
+ADDRESS = "0x5806E416dA447b267cEA759358cF22Cc41FAE80F"
+SWAPS = [
+    dict(
+        poolId=usdc_pool_address,
+        assetIn=zero_address,
+        amountIn=10**16,
+        assetOut=usdc_address,
+        amountOut=10**5,
+        userData=b"",
+    )
+]
+
+
+def web3_calls(w3):
+    bex = w3.eth.contract(address=bex_swap_address, abi=bex_abi)
+    honey_swap = w3.eth.contract(address=honey_swap_address, abi=honey_abi)
+    bend = w3.eth.contract(address=bend_address, abi=bend_abi)
+    bera_name = w3.eth.contract(address=bera_name_address, abi=bera_name_abi)
+    usdc = w3.eth.contract(address=usdc_address, abi=erc_20_abi)
+    return [
+        usdc.functions.approve(bex_swap_address, 2**256 - 1),
+        bex.functions.batchSwap(kind=0, swaps=SWAPS, deadline=99999999),
+        bex.functions.addLiquidity(usdc_pool_address, ADDRESS, [usdc_address], [10**5]),
+        honey_swap.functions.mint(ADDRESS, usdc_address, 10**5),
+        honey_swap.functions.redeem(ADDRESS, 10**5, usdc_address),
+        bend.functions.supply(usdc_address, 10**5, ADDRESS, 0),
+        bend.functions.borrow(wbear_address, 10**5, 2, 0, ADDRESS),
+        bera_name.functions.mintNative(list("name"), 1, ADDRESS, "uri", ADDRESS),
+    ]
+
+
+def encoder_calls():
+    return [
+        (usdc_address, lambda: encoder.approve(bex_swap_address, 2**256 - 1)),
+        (bex_swap_address, lambda: encoder.batch_swap(SWAPS, 99999999)),
+        (
+            bex_swap_address,
+            lambda: encoder.add_liquidity(usdc_pool_address, ADDRESS, [usdc_address], [10**5]),
+        ),
+        (honey_swap_address, lambda: encoder.honey_mint(ADDRESS, usdc_address, 10**5)),
+        (honey_swap_address, lambda: encoder.honey_redeem(ADDRESS, 10**5, usdc_address)),
+        (bend_address, lambda: encoder.bend_supply(usdc_address, 10**5, ADDRESS)),
+        (bend_address, lambda: encoder.bend_borrow(wbear_address, 10**5, 2, 0, ADDRESS)),
+        (
+            bera_name_address,
+            lambda: encoder.mint_native(list("name"), 1, ADDRESS, "uri", ADDRESS),
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    with StubRPCServer() as stub:
+        w3 = Web3(Web3.HTTPProvider(stub.url))
+        calls = web3_calls(w3)
+        for call, (to, encode) in zip(calls, encoder_calls()):
+            txn = call.buildTransaction({"gas": 500000, "gasPrice": 10**9, "nonce": 0})
+            assert txn == encoder.transaction(
+                to, encode(), stub.chain_id, 0, 500000, {"gasPrice": 10**9}
+            ), call.fn_name
+
+        stub.rpc_calls = 0
+        started = time.perf_counter()
+        for nonce in range(args.rounds):
+            for call in calls:
+                call.buildTransaction({"gas": 500000, "gasPrice": 10**9, "nonce": nonce})
+        elapsed = time.perf_counter() - started
+        built = args.rounds * len(calls)
+        print(
+            f"buildTransaction {built} txs in {elapsed:.2f}s "
+            f"({built / elapsed:.0f} tx/s, {stub.rpc_calls} RPC calls)"
+        )
+
+        stub.rpc_calls = 0
+        started = time.perf_counter()
+        for nonce in range(args.rounds):
+            for to, encode in encoder_calls():
+                encoder.transaction(
+                    to, encode(), stub.chain_id, nonce, 500000, {"gasPrice": 10**9}
+                )
+        elapsed = time.perf_counter() - started
+        print(
+            f"encoder          {built} txs in {elapsed:.2f}s "
+            f"({built / elapsed:.0f} tx/s, {stub.rpc_calls} RPC calls)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+import threading
+
+from eth.exceptions import Revert
+from eth.vm.forks import LondonVM
+from eth.vm.forks.london.computation import LondonComputation
+from eth.vm.forks.london.state import LondonState
+from eth_abi import decode_single, encode_single
+from eth_account import Account
+from eth_tester import EthereumTester, PyEVMBackend
+from eth_utils import (
+    big_endian_to_int,
+    decode_hex,
+    function_signature_to_4byte_selector,
+    keccak,
+    to_canonical_address,
+    to_checksum_address,
+)
+from web3 import Web3
+from web3.datastructures import NamedElementOnion
+from web3.providers.eth_tester import EthereumTesterProvider
+
+from benchmarks.stub_rpc import StubRPCServer
+from config.contracts_addresses import (
+    bend_address,
+    bera_name_address,
+    bex_swap_address,
+    honey_address,
+    honey_swap_address,
+    multicall3_address,
+    ooga_booga_address,
+    usdc_address,
+    weth_address,
+)
+
+STAND_IN_GAS = 30000
+TOKEN_BALANCE = 10**24
+WALLET_BALANCE = 10**24
+SWAP_PRICE = 2
+WETH_STAND_IN = "0x6001600c60003960016000f300"
+
+BALANCE_OF = function_signature_to_4byte_selector("balanceOf(address)")
+ALLOWANCE = function_signature_to_4byte_selector("allowance(address,address)")
+APPROVE = function_signature_to_4byte_selector("approve(address,uint256)")
+PREVIEW_SWAP_EXACT = function_signature_to_4byte_selector(
+    "getPreviewSwapExact(uint8,address,address,uint256,address)"
+)
+PREVIEW_BATCH_SWAP = function_signature_to_4byte_selector(
+    "getPreviewBatchSwap(uint8,(address,address,uint256,address,uint256,bytes)[])"
+)
+HAS_MINTED = function_signature_to_4byte_selector("hasMinted(address)")
+AGGREGATE3 = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+GET_ETH_BALANCE = function_signature_to_4byte_selector("getEthBalance(address)")
+
+
+def word(value):
+    return int(value).to_bytes(32, "big")
+
+
+CALLER = Account.from_key(word(1)).address
+
+
+def slot(*keys):
+    return big_endian_to_int(keccak(b"".join(to_canonical_address(key) for key in keys)))
+
+
+def erc20(state, address, sender, data):
+    selector, args = data[:4], data[4:]
+    if selector == BALANCE_OF:
+        return word(TOKEN_BALANCE)
+    if selector == ALLOWANCE:
+        owner, spender = decode_single("(address,address)", args)
+        return word(state.get_storage(address, slot(owner, spender)))
+    if selector == APPROVE:
+        spender, amount = decode_single("(address,uint256)", args)
+        state.set_storage(address, slot(sender, spender), amount)
+    return word(1)
+
+
+def bex(state, address, sender, data):
+    selector, args = data[:4], data[4:]
+    if selector == PREVIEW_SWAP_EXACT:
+        _, _, _, amount, quote_asset = decode_single(
+            "(uint8,address,address,uint256,address)", args
+        )
+        return encode_single("(address,uint256)", (quote_asset, amount * SWAP_PRICE))
+    if selector == PREVIEW_BATCH_SWAP:
+        _, swaps = decode_single(
+            "(uint8,(address,address,uint256,address,uint256,bytes)[])", args
+        )
+        return encode_single("(address,uint256)", (swaps[-1][3], swaps[0][2] * SWAP_PRICE))
+    return b""
+
+
+def ooga_booga(state, address, sender, data):
+    selector, args = data[:4], data[4:]
+    if selector == HAS_MINTED:
+        (owner,) = decode_single("(address)", args)
+        return word(state.get_storage(address, slot(owner)))
+    state.set_storage(address, slot(sender), 1)
+    return b""
+
+
+def accept(state, address, sender, data):
+    return b""
+
+
+def multicall(state, address, sender, data):
+    selector, args = data[:4], data[4:]
+    if selector == GET_ETH_BALANCE:
+        (owner,) = decode_single("(address)", args)
+        return word(state.get_balance(to_canonical_address(owner)))
+    if selector != AGGREGATE3:
+        raise Revert(b"")
+    results = []
+    for target, allow_failure, call_data in decode_single("((address,bool,bytes)[])", args)[0]:
+        target = to_canonical_address(target)
+        try:
+            results.append((True, STAND_INS[target](state, target, address, call_data)))
+        except (KeyError, Revert):
+            if not allow_failure:
+                raise Revert(b"")
+            results.append((False, b""))
+    return encode_single("((bool,bytes)[])", (results,))
+
+
+STAND_INS = {
+    to_canonical_address(address): handler
+    for address, handler in (
+        (usdc_address, erc20),
+        (weth_address, erc20),
+        (honey_address, erc20),
+        (bex_swap_address, bex),
+        (honey_swap_address, accept),
+        (bend_address, accept),
+        (ooga_booga_address, ooga_booga),
+        (bera_name_address, accept),
+        (multicall3_address, multicall),
+    )
+}
+
+
+def precompile(handler):
+    def run(computation):
+        computation.consume_gas(STAND_IN_GAS, reason="stand-in contract")
+        message = computation.msg
+        computation.output = handler(
+            computation.state,
+            message.storage_address,
+            message.sender,
+            message.data_as_bytes,
+        )
+        return computation
+
+    return run
+
+
+def stand_in_vm():
+    computation_class = LondonComputation.configure(
+        __name__="StandInComputation",
+        _precompiles={
+            **LondonComputation._precompiles,
+            **{address: precompile(handler) for address, handler in STAND_INS.items()},
+        },
+    )
+    state_class = LondonState.configure(
+        __name__="StandInState", computation_class=computation_class
+    )
+    return LondonVM.configure(__name__="StandInVM", _state_class=state_class)
+
+
+def genesis_state(addresses):
+    def account(balance, nonce=0):
+        return {"balance": balance, "nonce": nonce, "code": b"", "storage": {}}
+
+    state = {to_canonical_address(address): account(WALLET_BALANCE) for address in addresses}
+    state[to_canonical_address(CALLER)] = account(WALLET_BALANCE)
+    for address in STAND_INS:
+        state[address] = account(0, nonce=1)
+    return state
+
+
+def to_json(value):
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    return value
+
+
+class EVMServer(StubRPCServer):
+    def __init__(self, addresses, host="127.0.0.1"):
+        super().__init__(host=host)
+        vm = stand_in_vm()
+        self.tester = EthereumTester(
+            PyEVMBackend(
+                genesis_state=genesis_state(addresses),
+                vm_configuration=((0, vm),),
+            )
+        )
+        provider = EthereumTesterProvider(self.tester)
+        self._request = provider.request_func(Web3(provider), NamedElementOnion([]))
+        self._chain = self.tester.backend.chain
+        self._gas_limit = self._chain.header.gas_limit
+        self._transactions = vm.get_transaction_builder()
+        self._evm_lock = threading.Lock()
+        self._arrived = threading.Condition()
+        self._mempool = []
+        self._stopped = False
+        self._pending_nonces = {}
+        self._receipts = {}
+        self._miner = threading.Thread(target=self._mine, daemon=True)
+        self.blocks = 0
+        self.mined = 0
+        self.dropped = 0
+
+    def start(self):
+        self._miner.start()
+        return super().start()
+
+    def stop(self):
+        with self._arrived:
+            self._stopped = True
+            self._arrived.notify()
+        self._miner.join()
+        super().stop()
+
+    def _mine(self):
+        while True:
+            with self._arrived:
+                while not self._mempool and not self._stopped:
+                    self._arrived.wait()
+                if not self._mempool:
+                    return
+                block, gas = [], 0
+                for transaction in self._mempool:
+                    if block and gas + transaction.gas > self._gas_limit:
+                        break
+                    block.append(transaction)
+                    gas += transaction.gas
+                del self._mempool[:len(block)]
+            self._mine_block(block)
+
+    def _mine_block(self, transactions):
+        try:
+            with self._evm_lock:
+                result, receipts, computations = self._chain.mine_all(transactions)
+        except Exception:
+            if len(transactions) == 1:
+                self.dropped += 1
+                return
+            for transaction in transactions:
+                self._mine_block([transaction])
+            return
+        block = result.imported_block
+        cumulative_gas = 0
+        with self._lock:
+            for index, (transaction, receipt, computation) in enumerate(
+                zip(transactions, receipts, computations)
+            ):
+                self._receipts["0x" + transaction.hash.hex()] = {
+                    "transactionHash": "0x" + transaction.hash.hex(),
+                    "transactionIndex": hex(index),
+                    "blockHash": "0x" + block.hash.hex(),
+                    "blockNumber": hex(block.number),
+                    "from": to_checksum_address(transaction.sender),
+                    "to": to_checksum_address(transaction.to) if transaction.to else None,
+                    "cumulativeGasUsed": hex(receipt.gas_used),
+                    "gasUsed": hex(receipt.gas_used - cumulative_gas),
+                    "contractAddress": None,
+                    "logs": [],
+                    "status": hex(int(computation.is_success)),
+                }
+                cumulative_gas = receipt.gas_used
+            self.blocks += 1
+            self.mined += len(transactions)
+
+    def result(self, method, params):
+        if method == "eth_sendRawTransaction":
+            transaction = self._transactions.decode(decode_hex(params[0]))
+            sender = to_checksum_address(transaction.sender)
+            with self._lock:
+                self._pending_nonces[sender] = max(
+                    self._pending_nonces.get(sender, 0), transaction.nonce + 1
+                )
+            with self._arrived:
+                self._mempool.append(transaction)
+                self._arrived.notify()
+            return "0x" + transaction.hash.hex()
+        if method == "eth_getTransactionReceipt":
+            with self._lock:
+                return self._receipts.get(params[0].lower())
+        if method in ("eth_call", "eth_estimateGas"):
+            params = [dict(params[0], **{"from": CALLER}), *params[1:]]
+        with self._evm_lock:
+            try:
+                response = self._request(method, params)
+            except NotImplementedError:
+                raise KeyError(method)
+            except Exception as e:
+                raise ValueError(str(e))
+        if "error" in response:
+            raise ValueError(response["error"])
+        if method == "eth_getTransactionCount" and params[1] == "pending":
+            with self._lock:
+                pending = self._pending_nonces.get(to_checksum_address(params[0]), 0)
+            return hex(max(int(response["result"]), pending))
+        return to_json(response["result"])
+
+
+def serve(addresses, connection):
+    server = EVMServer(addresses).start()
+    connection.send(server.url)
+    connection.recv()
+    server.stop()
+    connection.send(
+        {
+            "rpc_calls": server.rpc_calls,
+            "http_requests": server.http_requests,
+            "blocks": server.blocks,
+            "mined": server.mined,
+            "dropped": server.dropped,
+        }
+    )
@@ -0,0 +1,29 @@
+import argparse
+
+from config.config import gas_limits
+from services.gas_profiler import GasProfiler
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profile", default=None)
+    parser.add_argument("--export", default=None)
+    args = parser.parse_args()
+
+    profiler = GasProfiler(args.profile)
+    table = profiler.export(args.export)
+    if not table:
+        print(f"No gas profile in {profiler.path}. Run some routes first.")
+        return
+    print(f"{'action':<60} {'samples':>7} {'p50':>9} {'limit':>9} {'fixed':>9} {'saved':>6}")
+    for key, row in table.items():
+        fixed = gas_limits.get(key.split(":")[0], gas_limits["default"])
+        limit = row["limit"] or fixed
+        print(
+            f"{key:<60} {row['samples']:>7} {row['p50']:>9} {limit:>9} {fixed:>9} "
+            f"{1 - limit / fixed:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
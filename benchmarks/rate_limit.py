@@ -0,0 +1,65 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+from web3 import Web3
+
+from benchmarks.stub_rpc import StubRPCServer
+from services.rate_limiter import RateLimitedProvider
+
+ADDRESS = "0x5806E416dA447b267cEA759358cF22Cc41FAE80F"
+
+
+def run(name, provider, stub, threads, duration):
+    w3 = Web3(provider)
+    stub.rejected = 0
+    deadline = time.monotonic() + duration
+
+    def worker(_):
+        ok = failed = 0
+        while time.monotonic() < deadline:
+            try:
+                w3.eth.get_balance(ADDRESS)
+                ok += 1
+            except Exception:
+                failed += 1
+        return ok, failed
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - started
+    ok = sum(result[0] for result in results)
+    failed = sum(result[1] for result in results)
+    print(
+        f"{name:<14} {ok / elapsed:>6.0f} ok/s, {failed} failed, "
+        f"{stub.rejected} rejected by the endpoint"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate-limit", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    with StubRPCServer(latency=args.latency, rate_limit=args.rate_limit) as stub:
+        run("no limiter", Web3.HTTPProvider(stub.url), stub, args.threads, args.duration)
+        time.sleep(1)
+        provider = RateLimitedProvider(Web3.HTTPProvider(stub.url))
+        run("AIMD limiter", provider, stub, args.threads, args.duration)
+        stats = provider.stats()["read"]
+        print(
+            f"{'':<14} final limit {stats['rate']} req/s, {stats['throttled']} 429s, "
+            f"{stats['throughput']} req/s sustained"
+        )
+
+
+if __name__ == "__main__":
+    main()
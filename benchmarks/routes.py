@@ -0,0 +1,154 @@
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import partial
+
+from eth_account import Account
+from loguru import logger
+
+import config.config as config
+from benchmarks.evm import WETH_STAND_IN, serve
+from config.contracts_addresses import honey_address, usdc_address, weth_address
+
+ROUTES = {
+    "base": lambda main: main.executor.run(main.base_route, main.wallets),
+    "swap": lambda main: main.executor.run(
+        partial(main.swap_route, snapshot=main.snapshot_wallets()), main.wallets
+    ),
+    "liquidity": lambda main: main.executor.run(
+        partial(main.liquidity_route, snapshot=main.snapshot_wallets([usdc_address, weth_address])),
+        main.wallets,
+    ),
+    "mint_honey": lambda main: main.executor.run(
+        partial(main.mint_honey_route, snapshot=main.snapshot_wallets([usdc_address])),
+        main.wallets,
+    ),
+    "redeem_honey": lambda main: main.executor.run(
+        partial(main.redeem_honey_route, snapshot=main.snapshot_wallets([honey_address])),
+        main.wallets,
+    ),
+    "deposit_bend": lambda main: main.executor.run(
+        partial(main.deposit_bend_route, snapshot=main.snapshot_wallets([usdc_address])),
+        main.wallets,
+    ),
+    "borrow_bend": lambda main: main.executor.run(main.borrow_bend_route, main.wallets),
+    "honey_jar": lambda main: main.bulk_route("Minting Honey Jar", main.bera.bulk_honey_jar_mint),
+    "deploy_contract": lambda main: main.bulk_route(
+        "Deploying contract", main.bera.bulk_deploy_contract
+    ),
+    "bera_name": lambda main: main.bulk_route("Creating bera name", main.bera.bulk_create_bera_name),
+}
+
+
+def start_evm(addresses):
+    connection, child = multiprocessing.Pipe()
+    process = multiprocessing.get_context("spawn").Process(
+        target=serve, args=(addresses, child), daemon=True
+    )
+    process.start()
+    return process, connection, connection.recv()
+
+
+def stop_evm(process, connection):
+    connection.send(None)
+    stats = connection.recv()
+    process.join()
+    return stats
+
+
+@contextmanager
+def workspace(private_keys):
+    root = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "data"))
+        with open(os.path.join(directory, "data", "wallets.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(private_keys))
+        open(os.path.join(directory, "data", "proxy.txt"), "w").close()
+        os.chdir(directory)
+        try:
+            yield directory
+        finally:
+            os.chdir(root)
+
+
+def load_main():
+    config.weth_bytecode = WETH_STAND_IN
+    import main
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+    return main
+
+
+def point_main(main, url, directory):
+    from services.berachain import BeraChain
+    from services.wallets import WalletRegistry
+
+    bera = BeraChain([url], cache_dir=os.path.join(directory, "data", "cache"), metrics_path="")
+    main.bera = bera
+    main.wallets = WalletRegistry.from_file("data/wallets.txt")
+    return bera
+
+
+def counts(bera):
+    summary = bera.metrics.summary()
+    return {
+        "rpc": sum(values["count"] for name, values in summary.items() if name.startswith("rpc.")),
+        "actions": summary.get("rpc.eth_sendRawTransaction", {}).get("count", 0),
+        "errors": sum(
+            values["errors"] for name, values in summary.items() if name.startswith("bera.")
+        ),
+    }
+
+
+def run(name, private_keys, main=None):
+    addresses = [Account.from_key(key).address for key in private_keys]
+    process, connection, url = start_evm(addresses)
+    try:
+        with workspace(private_keys) as directory:
+            main = main or load_main()
+            bera = point_main(main, url, directory)
+            bera.faker.name()
+            before = counts(bera)
+            cpu = time.process_time()
+            started = time.perf_counter()
+            ROUTES[name](main)
+            elapsed = time.perf_counter() - started
+            cpu = time.process_time() - cpu
+            after = counts(bera)
+            bera.allowances.flush()
+            bera.profiler.flush()
+    finally:
+        evm = stop_evm(process, connection)
+    actions = after["actions"] - before["actions"]
+    rpc = after["rpc"] - before["rpc"]
+    print(
+        f"{name:<16} {len(private_keys):>5} wallets in {elapsed:7.2f}s "
+        f"({len(private_keys) / elapsed * 60:7.0f} wallets/min, {actions:>5} actions, "
+        f"{rpc / max(actions, 1):5.2f} RPCs/action, "
+        f"{evm['http_requests'] / max(actions, 1):5.2f} HTTP/action, "
+        f"{cpu * 1000 / max(actions, 1):6.2f} ms CPU/action, "
+        f"{after['errors'] - before['errors'] + evm['dropped']} errors)"
+    )
+    return main
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wallets", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--routes", nargs="+", choices=list(ROUTES), default=list(ROUTES))
+    args = parser.parse_args()
+
+    module = None
+    for wallets in args.wallets:
+        private_keys = [Account.create().key.hex() for _ in range(wallets)]
+        for name in args.routes:
+            module = run(name, private_keys, module)
+
+
+if __name__ == "__main__":
+    main()
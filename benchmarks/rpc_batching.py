@@ -0,0 +1,44 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from web3 import Web3
+
+from benchmarks.stub_rpc import StubRPCServer
+from services.batching_provider import BatchingHTTPProvider
+
+ADDRESS = "0x5806E416dA447b267cEA759358cF22Cc41FAE80F"
+
+
+def run(provider, stub, calls, threads):
+    w3 = Web3(provider)
+    stub.http_requests = 0
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        balances = list(pool.map(lambda _: w3.eth.get_balance(ADDRESS), range(calls)))
+    elapsed = time.perf_counter() - started
+    assert all(balance == 10**18 for balance in balances)
+    return elapsed, stub.http_requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    with StubRPCServer(latency=args.latency) as stub:
+        for name, provider in (
+            ("HTTPProvider", Web3.HTTPProvider(stub.url)),
+            ("BatchingHTTPProvider", BatchingHTTPProvider(stub.url)),
+        ):
+            elapsed, http_requests = run(provider, stub, args.calls, args.threads)
+            print(
+                f"{name:<22} {args.calls} calls in {elapsed:.2f}s "
+                f"({args.calls / elapsed:.0f} calls/s, {http_requests} HTTP requests)"
+            )
+
+
+if __name__ == "__main__":
+    main()
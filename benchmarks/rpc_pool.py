@@ -0,0 +1,72 @@
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from eth_account import Account
+from loguru import logger
+from web3 import Web3
+
+from benchmarks.stub_rpc import StubRPCServer
+from services.batching_provider import BatchingHTTPProvider
+from services.rpc_pool import RPCPool
+
+ADDRESS = "0x5806E416dA447b267cEA759358cF22Cc41FAE80F"
+
+
+def reads(w3, calls, threads):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(lambda _: w3.eth.get_balance(ADDRESS), range(calls)))
+    assert all(balance == 10**18 for balance in results)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=20)
+    parser.add_argument("--accounts", type=int, default=50)
+    parser.add_argument("--latency", type=float, nargs="+", default=[0.2, 0.05, 0.02])
+    parser.add_argument("--error-rate", type=float, default=0.8)
+    args = parser.parse_args()
+    logger.remove()
+    logger.add(sys.stderr, level="INFO")
+
+    stubs = [StubRPCServer(latency=latency).start() for latency in args.latency]
+    stubs.append(StubRPCServer(latency=min(args.latency), error_rate=args.error_rate).start())
+    try:
+        w3 = Web3(BatchingHTTPProvider(stubs[0].url))
+        elapsed = reads(w3, args.calls, args.threads)
+        print(f"{'single endpoint':<16} {args.calls} reads in {elapsed:.2f}s ({args.calls / elapsed:.0f} calls/s)")
+
+        pool = RPCPool([stub.url for stub in stubs], eject_seconds=60)
+        elapsed = reads(Web3(pool), args.calls, args.threads)
+        print(f"{'RPC pool':<16} {args.calls} reads in {elapsed:.2f}s ({args.calls / elapsed:.0f} calls/s, {pool.failovers} failovers)")
+
+        w3 = Web3(pool)
+        accounts = [Account.create().address for _ in range(args.accounts)]
+        for stub in stubs:
+            stub.nonces.clear()
+        for _ in range(3):
+            for address in accounts:
+                with pool.pinned(address) as endpoint:
+                    w3.eth.get_transaction_count(address, "pending")
+                    stubs[[stub.url for stub in stubs].index(endpoint.url)].nonces[address.lower()] = 1
+        nonces = [w3.eth.get_transaction_count(address, "pending") for address in accounts]
+        assert all(nonce == 1 for nonce in nonces), nonces
+        print(f"{'pinned accounts':<16} {args.accounts} accounts saw coherent nonces")
+
+        print(f"{'endpoint':<24} {'latency':>8} {'requests':>8} {'errors':>7} {'state':>8}")
+        for stub, (url, row) in zip(stubs, pool.stats().items()):
+            print(
+                f"{url:<24} {stub.latency * 1000:>6.0f}ms {row['requests']:>8} "
+                f"{row['error_rate']:>7.0%} {'ejected' if row['ejected'] else 'healthy':>8}"
+            )
+    finally:
+        for stub in stubs:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
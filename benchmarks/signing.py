@@ -0,0 +1,57 @@
+import argparse
+import os
+import time
+
+from eth_account import Account
+
+from services.signer import BulkSigner
+from services.wallets import WalletRegistry
+
+
+def transactions(wallets, count):
+    return [
+        (
+            wallets.wallets[index % len(wallets)],
+            {
+                "chainId": 80085,
+                "nonce": index // len(wallets),
+                "gasPrice": 10**9,
+                "gas": 500000,
+                "to": wallets.wallets[(index + 1) % len(wallets)].address,
+                "value": 0,
+                "data": "0xa6f2ae3a",
+            },
+        )
+        for index in range(count)
+    ]
+
+
+def run(name, signer, jobs):
+    started = time.perf_counter()
+    signed = signer.sign(jobs)
+    elapsed = time.perf_counter() - started
+    assert len(signed) == len(jobs)
+    print(f"{name:<28} {len(jobs)} signatures in {elapsed:.2f}s ({len(jobs) / elapsed:.0f}/s)")
+    return signed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wallets", type=int, default=100)
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    wallets = WalletRegistry([Account.create().key.hex() for _ in range(args.wallets)])
+    jobs = transactions(wallets, args.transactions)
+
+    single = run("single thread", BulkSigner(processes=1), jobs)
+    signer = BulkSigner(processes=args.processes)
+    run(f"{args.processes} processes (cold pool)", signer, jobs)
+    pooled = run(f"{args.processes} processes (warm pool)", signer, jobs)
+    signer.close()
+    assert single == pooled
+
+
+if __name__ == "__main__":
+    main()
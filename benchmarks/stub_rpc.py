@@ -0,0 +1,157 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from eth_utils import keccak
+
+
+class StubRPCServer:
+    def __init__(
+        self,
+        latency=0.0,
+        receipt_delay=0.0,
+        error_rate=0.0,
+        rate_limit=None,
+        chain_id=80085,
+        gas_price=10**9,
+        host="127.0.0.1",
+    ):
+        self.latency = latency
+        self.receipt_delay = receipt_delay
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rejected = 0
+        self._tokens = rate_limit or 0
+        self._refilled_at = time.monotonic()
+        self.chain_id = chain_id
+        self.gas_price = gas_price
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.calls_by_method = {}
+        self.nonces = {}
+        self.sent = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def result(self, method, params):
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "eth_gasPrice":
+            return hex(self.gas_price)
+        if method == "eth_blockNumber":
+            return hex(1)
+        if method == "eth_feeHistory":
+            blocks = int(params[0], 16) if isinstance(params[0], str) else params[0]
+            return {
+                "oldestBlock": hex(2 - blocks),
+                "baseFeePerGas": [hex(self.gas_price)] * (blocks + 1),
+                "gasUsedRatio": [0.5] * blocks,
+                "reward": [
+                    [hex(self.gas_price * percentile // 100) for percentile in params[2]]
+                ] * blocks,
+            }
+        if method == "eth_getBalance":
+            return hex(10**18)
+        if method == "eth_getTransactionCount":
+            return hex(self.nonces.get(params[0].lower(), 0))
+        if method == "eth_call":
+            return "0x" + "00" * 64
+        if method == "eth_sendRawTransaction":
+            tx_hash = "0x" + keccak(hexstr=params[0]).hex()
+            self.sent[tx_hash] = time.monotonic()
+            return tx_hash
+        if method == "eth_getTransactionReceipt":
+            sent_at = self.sent.get(params[0].lower())
+            if sent_at is None or time.monotonic() - sent_at < self.receipt_delay:
+                return None
+            return {
+                "transactionHash": params[0],
+                "status": "0x1",
+                "gasUsed": hex(21000),
+                "blockNumber": hex(1),
+            }
+        raise KeyError(method)
+
+    def admit(self, calls):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit
+            )
+            self._refilled_at = now
+            if self._tokens < calls:
+                self.rejected += calls
+                return False
+            self._tokens -= calls
+            return True
+
+    def respond(self, request):
+        with self._lock:
+            self.rpc_calls += 1
+            self.calls_by_method[request["method"]] = (
+                self.calls_by_method.get(request["method"], 0) + 1
+            )
+        response = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            response["result"] = self.result(request["method"], request.get("params", []))
+        except KeyError:
+            response["error"] = {"code": -32601, "message": "Method not found"}
+        except ValueError as e:
+            response["error"] = {"code": -32000, "message": str(e)}
+        return response
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub._lock:
+                    stub.http_requests += 1
+                if stub.latency:
+                    time.sleep(stub.latency)
+                if stub.error_rate and random.random() < stub.error_rate:
+                    self.send_error(429, "Too Many Requests")
+                    return
+                if stub.rate_limit and not stub.admit(len(body) if isinstance(body, list) else 1):
+                    self.send_error(429, "Too Many Requests")
+                    return
+                if isinstance(body, list):
+                    payload = [stub.respond(request) for request in body]
+                else:
+                    payload = stub.respond(body)
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -2834,4 +2834,50 @@ bera_name_abi = [
                    {"internalType": "address", "name": "aka", "type": "address"}], "name": "updateWhois", "outputs": [],
         "stateMutability": "nonpayable", "type": "function"},
     {"inputs": [], "name": "whitelistEnabled", "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
-     "stateMutability": "view", "type": "function"}]
\ No newline at end of file
+     "stateMutability": "view", "type": "function"}]
+multicall3_abi = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+def fragment(abi, *names):
+    return [item for item in abi if item.get("name") in names]
+
+
+bex_quote_abi = fragment(bex_abi, "getPreviewSwapExact", "getPreviewBatchSwap")
+erc_20_read_abi = fragment(erc_20_abi, "balanceOf", "allowance")
+ooga_booga_read_abi = fragment(ooga_booga_abi, "hasMinted")
@@ -1,2 +1,44 @@
 rpc_url = "https://rpc.ankr.com/berachain_testnet"
-twocaptcha_apikey = "your_api_key_here"
\ No newline at end of file
+rpc_urls = [rpc_url]
+twocaptcha_apikey = "your_api_key_here"
+cache_dir = "data/cache"
+weth_bytecode = ""
+gas_price_ttl = 5
+gas_price_multipliers = {"default": 1.5, "create_bera_name": 1.15}
+fee_mode = "legacy"
+fee_strategies = {"default": "normal", "bex_swap": "fast", "deploy_contract": "cheap", "create_bera_name": "cheap"}
+fee_strategy_percentiles = {"cheap": 10, "normal": 50, "fast": 90}
+fee_history_blocks = 10
+base_fee_multiplier = 2
+gas_limits = {"default": 500000, "deploy_contract": 2000000, "create_bera_name": 2000000}
+gas_limit_jitter = 10000
+gas_profile_window = 50
+gas_profile_percentile = 95
+gas_profile_headroom = 1.2
+gas_profile_min_samples = 5
+gas_profile_save_interval = 5
+multicall_chunk_size = 300
+contract_cache_size = 256
+checksum_cache_size = 4096
+rpc_pool_window = 20
+rpc_pool_min_samples = 5
+rpc_pool_max_error_rate = 0.5
+rpc_pool_eject_seconds = 30
+rpc_rate_limits = {"read": 100, "send": 50}
+rpc_rate_min = 1
+rpc_rate_max = 1000
+rpc_rate_increase = 10
+rpc_rate_decrease = 0.5
+rpc_rate_latency_factor = 3
+rpc_batch_window = 0.005
+rpc_batch_size = 50
+max_workers = 10
+signer_processes = None
+signer_chunk_size = 64
+metrics_path = "data/cache/metrics.json"
+metrics_window = 10000
+receipt_poll_interval = 1
+receipt_timeout = 120
+allowance_cache_save_interval = 5
+quote_block_ttl = 2
+route_cache_ttl = 30
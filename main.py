@@ -1,21 +1,26 @@
 import random
 import sys
+from functools import partial
 
 import requests
-from eth_account import Account
 from loguru import logger
-from faker import Faker
 import time
 
 from services.berachain import BeraChain
+from services.executor import WalletExecutor
+from services.pipeline import ActionPipeline
 from services.twocaptcha import TwoCaptcha
 from services.files import read_file_lines
+from services.wallets import WalletRegistry
 
 from config.contracts_addresses import (
     usdc_address,
+    honey_address,
     wbear_address,
     weth_address,
     bex_approve_liquidity_address,
+    honey_swap_address,
+    bend_address,
     usdc_pool_liquidity_address,
     weth_pool_liquidity_address,
 )
@@ -29,209 +34,236 @@ logger.add(
     " - <white>{message}</white>",
 )
 
-bera = BeraChain()
+bera = None
 captcha_solver = TwoCaptcha()
-faker = Faker()
 session = requests.Session()
+executor = WalletExecutor()
 
-wallets = read_file_lines("data/wallets.txt")
-proxies = read_file_lines("data/proxy.txt")
+wallets = []
+proxies = []
 
 
-def claim_bera(wallets, proxies):
-    for wallet_key, proxy in zip(wallets, proxies):
-        account = Account.from_key(wallet_key.strip())
-        logger.info(f"Claiming BERA for {account.address} using proxy {proxy}...")
-        try:
-            response = bera.claim_bera_from_faucet(
-                account.address, captcha_solver, faker, proxy
-            )
-            if response.ok:
-                logger.success(f"Successfully claimed BERA for {account.address}.")
-            else:
-                logger.error(
-                    f"Failed to claim BERA for {account.address}: {response.text}"
-                )
-        except Exception as e:
+def setup():
+    global bera, wallets, proxies
+    bera = BeraChain()
+    wallets = WalletRegistry.from_file("data/wallets.txt")
+    proxies = read_file_lines("data/proxy.txt")
+
+
+def confirm(result):
+    if not isinstance(result, str) or not result.startswith("0x"):
+        return True
+    try:
+        receipt = bera.receipts.wait(result)
+    except Exception as e:
+        logger.error(f"Transaction {result} is not confirmed: {str(e)}")
+        return False
+    if receipt["status"] != 1:
+        logger.error(f"Transaction {result} reverted in block {receipt['blockNumber']}")
+        return False
+    return True
+
+
+def claim_bera_wallet(wallet, proxy):
+    logger.info(f"Claiming BERA for {wallet.address} using proxy {proxy}...")
+    try:
+        response = bera.claim_bera_from_faucet(
+            wallet.address, captcha_solver, bera.faker, proxy
+        )
+        if response.ok:
+            logger.success(f"Successfully claimed BERA for {wallet.address}.")
+        else:
             logger.error(
-                f"Exception occurred while claiming BERA for {account.address}: {str(e)}"
+                f"Failed to claim BERA for {wallet.address}: {response.text}"
             )
-        time.sleep(2)
+    except Exception as e:
+        logger.error(
+            f"Exception occurred while claiming BERA for {wallet.address}: {str(e)}"
+        )
+    time.sleep(2)
 
 
-def bex_swap(wallet_key, asset_in_address, asset_out_address, amount_in):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Starting token swap for {account.address}...")
+def claim_bera(wallets, proxies):
+    executor.run(claim_bera_wallet, wallets, proxies)
+
+
+def bex_swap(wallet, asset_in_address, asset_out_address, amount_in):
+    logger.info(f"Starting token swap for {wallet.address}...")
     try:
         result = bera.bex_swap(
-            account.address,
-            wallet_key,
+            wallet,
             asset_in_address,
             asset_out_address,
             amount_in,
-            faker,
+            bera.faker,
             session,
         )
         if "ERR" not in result:
-            logger.success(f"Swap success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Swap success. TxID: {result}")
         else:
-            logger.error(f"Swap failed for {account.address}: {result}")
+            logger.error(f"Swap failed for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception during swap for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception during swap for {wallet.address}: {str(e)}")
 
 
-def add_liquidity_usdc(wallet_key, amount: int):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Adding liquidity in USDC for {account.address}...")
+def add_liquidity_usdc(wallet, amount: int):
+    logger.info(f"Adding liquidity in USDC for {wallet.address}...")
     try:
         result = bera.bex_add_liquidity(
-            account.address,
-            wallet_key,
+            wallet,
             amount,
             usdc_pool_liquidity_address,
             usdc_address,
         )
         if "ERR" not in result:
-            logger.success(f"Liquidity addition success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Liquidity addition success. TxID: {result}")
         else:
-            logger.error(f"Failed to add liquidity for {account.address}: {result}")
+            logger.error(f"Failed to add liquidity for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception adding USDC liquidity for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception adding USDC liquidity for {wallet.address}: {str(e)}")
 
 
-def add_liquidity_weth(wallet_key, amount: int):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Adding liquidity in WETH for {account.address}...")
+def add_liquidity_weth(wallet, amount: int):
+    logger.info(f"Adding liquidity in WETH for {wallet.address}...")
     try:
         result = bera.bex_add_liquidity(
-            account.address,
-            wallet_key,
+            wallet,
             amount,
             weth_pool_liquidity_address,
             weth_address,
         )
         if "ERR" not in result:
-            logger.success(f"Liquidity addition success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Liquidity addition success. TxID: {result}")
         else:
-            logger.error(f"Failed to add liquidity for {account.address}: {result}")
+            logger.error(f"Failed to add liquidity for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception adding WETH liquidity for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception adding WETH liquidity for {wallet.address}: {str(e)}")
 
 
-def mint_honey(wallet_key, amount_usdc):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Minting Honey for {account.address}...")
+def mint_honey(wallet, amount_usdc):
+    logger.info(f"Minting Honey for {wallet.address}...")
     try:
-        result = bera.honey_mint(account.address, wallet_key, amount_usdc)
+        result = bera.honey_mint(wallet, amount_usdc)
         if "ERR" not in result:
-            logger.success(f"Honey minting success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Honey minting success. TxID: {result}")
         else:
-            logger.error(f"Failed to mint Honey for {account.address}: {result}")
+            logger.error(f"Failed to mint Honey for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception during Honey minting for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception during Honey minting for {wallet.address}: {str(e)}")
 
 
-def redeem_honey(wallet_key, amount_honey):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Redeeming Honey for USDC for {account.address}...")
+def redeem_honey(wallet, amount_honey):
+    logger.info(f"Redeeming Honey for USDC for {wallet.address}...")
     try:
-        result = bera.honey_redeem(account.address, wallet_key, amount_honey)
+        result = bera.honey_redeem(wallet, amount_honey)
         if "ERR" not in result:
-            logger.success(f"Honey redemption success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Honey redemption success. TxID: {result}")
         else:
-            logger.error(f"Failed to redeem Honey for {account.address}: {result}")
+            logger.error(f"Failed to redeem Honey for {wallet.address}: {result}")
     except Exception as e:
         logger.error(
-            f"Exception during Honey redemption for {account.address}: {str(e)}"
+            f"Exception during Honey redemption for {wallet.address}: {str(e)}"
         )
-    finally:
-        time.sleep(2)
 
 
-def deposit_bend(wallet_key, token_address, amount):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Depositing to Bend for {account.address}...")
+def deposit_bend(wallet, token_address, amount):
+    logger.info(f"Depositing to Bend for {wallet.address}...")
     try:
-        result = bera.bend_deposit(account.address, wallet_key, token_address, amount)
+        result = bera.bend_deposit(wallet, token_address, amount)
         if "ERR" not in result:
-            logger.success(f"Bend deposit success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Bend deposit success. TxID: {result}")
         else:
-            logger.error(f"Failed to deposit in Bend for {account.address}: {result}")
+            logger.error(f"Failed to deposit in Bend for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception during Bend deposit for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception during Bend deposit for {wallet.address}: {str(e)}")
 
 
-def borrow_bend(wallet_key, asset_token_address, amount):
-    account = Account.from_key(wallet_key.strip())
-    logger.info(f"Borrowing from Bend for {account.address}...")
+def borrow_bend(wallet, asset_token_address, amount):
+    logger.info(f"Borrowing from Bend for {wallet.address}...")
     try:
-        result = bera.bend_borrow(
-            account.address, wallet_key, amount, asset_token_address
-        )
+        result = bera.bend_borrow(wallet, amount, asset_token_address)
         if "ERR" not in result:
-            logger.success(f"Bend borrow success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Bend borrow success. TxID: {result}")
         else:
-            logger.error(f"Failed to borrow from Bend for {account.address}: {result}")
+            logger.error(f"Failed to borrow from Bend for {wallet.address}: {result}")
     except Exception as e:
-        logger.error(f"Exception during Bend borrowing for {account.address}: {str(e)}")
-    finally:
-        time.sleep(2)
+        logger.error(f"Exception during Bend borrowing for {wallet.address}: {str(e)}")
 
 
-def honey_jar_mint(wallet_key):
-    account = Account.from_key(wallet_key.strip())
-    address = account.address.strip()
+def honey_jar_mint(wallet):
+    address = wallet.address
     logger.info(f"Minting Honey Jar for {address}...")
     try:
-        result = bera.honey_jar_mint(address, wallet_key)
+        result = bera.honey_jar_mint(wallet)
         if "ERR" not in result:
-            logger.success(f"Honey Jar minting success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Honey Jar minting success. TxID: {result}")
         else:
             logger.error(f"Failed to mint Honey Jar for {address}: {result}")
     except Exception as e:
         logger.error(f"Exception during Honey Jar minting for {address}: {str(e)}")
-    finally:
-        time.sleep(2)
 
-def deploy_contract(wallet_key):
-    account = Account.from_key(wallet_key.strip())
-    address = account.address.strip()
+def deploy_contract(wallet):
+    address = wallet.address
     logger.info(f"Deploying contract for {address}...")
     try:
-        result = bera.deploy_contract(address, wallet_key)
+        result = bera.deploy_contract(wallet)
         if "ERR" not in result:
-            logger.success(f"Deploy success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Deploy success. TxID: {result}")
         else:
             logger.error(f"Failed to deploy contract for {address}: {result}")
     except Exception as e:
         logger.error(f"Exception during contract deploying for {address}: {str(e)}")
-    finally:
-        time.sleep(2)
 
-def bera_name(wallet_key):
-    account = Account.from_key(wallet_key.strip())
-    address = account.address.strip()
+def bera_name(wallet):
+    address = wallet.address
     logger.info(f"Creating bera name for {address}...")
     try:
-        result = bera.create_bera_name(address, wallet_key)
+        result = bera.create_bera_name(wallet)
         if "ERR" not in result:
-            logger.success(f"Create success. TxID: {result}")
+            if confirm(result):
+                logger.success(f"Create success. TxID: {result}")
         else:
             logger.error(f"Failed to create bera name for {address}: {result}")
     except Exception as e:
         logger.error(f"Exception during bera name for {address}: {str(e)}")
-    finally:
-        time.sleep(2)
+
+
+def bulk_route(name, send_bulk):
+    wallet_list = list(wallets)
+    logger.info(f"{name} for {len(wallet_list)} wallets in bulk...")
+    try:
+        results = send_bulk(wallet_list)
+    except Exception as e:
+        logger.error(f"Exception during bulk {name.lower()}: {str(e)}")
+        return
+    order_hashes = [
+        result for result in results if isinstance(result, str) and result.startswith("0x")
+    ]
+    receipts = dict(zip(order_hashes, bera.receipts.wait_all(order_hashes)))
+    for wallet, result in zip(wallet_list, results):
+        if result is True:
+            logger.info(f"{name} is already done for {wallet.address}")
+        elif result not in receipts:
+            logger.error(f"{name} failed for {wallet.address}: {result}")
+        elif isinstance(receipts[result], Exception):
+            logger.error(f"Transaction {result} is not confirmed: {str(receipts[result])}")
+        elif receipts[result]["status"] != 1:
+            logger.error(f"Transaction {result} reverted in block {receipts[result]['blockNumber']}")
+        else:
+            logger.success(f"{name} success for {wallet.address}. TxID: {result}")
+
+
+def snapshot_wallets(tokens=(), spenders=()):
+    return bera.snapshot_accounts(wallets.addresses, tokens, spenders)
 
 
 def main_menu():
@@ -257,42 +289,189 @@ def choose_activity_menu():
     print("10. Back to main menu")
 
 
-def perform_random_activity():
-    for wallet_key in wallets:
-        account = Account.from_key(wallet_key.strip())
-        activities = [
-            lambda: bex_swap(wallet_key, wbear_address, usdc_address,
-                             int(random.randrange(1, 3, 1) / 10 * bera.w3.eth.get_balance(account.address))),
-            lambda: bex_swap(wallet_key, wbear_address, weth_address,
+def random_route(wallet):
+    activities = [
+        lambda: bex_swap(wallet, wbear_address, usdc_address,
+                         int(random.randrange(1, 3, 1) / 10 * bera.w3.eth.get_balance(wallet.address))),
+        lambda: bex_swap(wallet, wbear_address, weth_address,
+                         int(random.randrange(1, 3, 1) / 10 * bera.usdc_contract.functions.balanceOf(
+                             wallet.address).call())),
+
+        lambda: add_liquidity_usdc(wallet, int(random.randrange(1, 3,
+                                                                    1) / 10 * bera.usdc_contract.functions.balanceOf(
+            wallet.address).call())),
+        lambda: add_liquidity_weth(wallet, int(random.randrange(1, 3,
+                                                                    1) / 10 * bera.weth_contract.functions.balanceOf(
+            wallet.address).call())),
+        lambda: mint_honey(wallet,
+                           int(random.randrange(1, 3, 1) / 10 * bera.usdc_contract.functions.balanceOf(
+                               wallet.address).call())),
+        lambda: redeem_honey(wallet,
+                             int(random.randrange(1, 3, 1) / 10 * bera.honey_contract.functions.balanceOf(
+                                 wallet.address).call())),
+        lambda: deposit_bend(wallet, usdc_address,
                              int(random.randrange(1, 3, 1) / 10 * bera.usdc_contract.functions.balanceOf(
-                                 account.address).call())),
-
-            lambda: add_liquidity_usdc(wallet_key, int(random.randrange(1, 3,
-                                                                        1) / 10 * bera.usdc_contract.functions.balanceOf(
-                account.address).call())),
-            lambda: add_liquidity_weth(wallet_key, int(random.randrange(1, 3,
-                                                                        1) / 10 * bera.weth_contract.functions.balanceOf(
-                account.address).call())),
-            lambda: mint_honey(wallet_key,
-                               int(random.randrange(1, 3, 1) / 10 * bera.usdc_contract.functions.balanceOf(
-                                   account.address).call())),
-            lambda: redeem_honey(wallet_key,
-                                 int(random.randrange(1, 3, 1) / 10 * bera.honey_contract.functions.balanceOf(
-                                     account.address).call())),
-            lambda: deposit_bend(wallet_key, usdc_address,
-                                 int(random.randrange(1, 3, 1) / 10 * bera.usdc_contract.functions.balanceOf(
-                                     account.address).call())),
-            lambda: borrow_bend(wallet_key, weth_address, 0.01 * 10 ** 18),
-            lambda: honey_jar_mint(wallet_key),
-            lambda: deploy_contract(wallet_key),
-            lambda: bera_name(wallet_key)
-        ]
-
-        random.shuffle(activities)
-
-        for activity in activities:
-            activity()
-            time.sleep(random.randint(5, 30))
+                                 wallet.address).call())),
+        lambda: borrow_bend(wallet, weth_address, 0.01 * 10 ** 18),
+        lambda: honey_jar_mint(wallet),
+        lambda: deploy_contract(wallet),
+        lambda: bera_name(wallet)
+    ]
+
+    random.shuffle(activities)
+
+    for activity in activities:
+        activity()
+        time.sleep(random.randint(5, 30))
+
+
+def perform_random_activity():
+    executor.run(random_route, wallets)
+
+
+def base_route(wallet):
+    address = wallet.address
+
+    def share_of(balance):
+        return int(random.randrange(1, 3, 1) / 10 * balance)
+
+    def token_balance(contract):
+        return contract.functions.balanceOf(address).call()
+
+    bera_balance = bera.w3.eth.get_balance(address)
+    pipeline = ActionPipeline(bera.receipts, address)
+    pipeline.add(
+        "swap_bera_to_usdc",
+        lambda: bera.bex_swap(
+            wallet, wbear_address, usdc_address,
+            share_of(bera_balance), bera.faker, session,
+        ),
+    )
+    pipeline.add(
+        "swap_bera_to_weth",
+        lambda: bera.bex_swap(
+            wallet, wbear_address, weth_address,
+            share_of(bera_balance), bera.faker, session,
+        ),
+    )
+    pipeline.add("deploy_contract", lambda: bera.deploy_contract(wallet))
+    pipeline.add("bera_name", lambda: bera.create_bera_name(wallet))
+    pipeline.add(
+        "add_liquidity_usdc",
+        lambda: bera.bex_add_liquidity(
+            wallet, share_of(token_balance(bera.usdc_contract)),
+            usdc_pool_liquidity_address, usdc_address,
+        ),
+        depends_on=["swap_bera_to_usdc"],
+    )
+    pipeline.add(
+        "add_liquidity_weth",
+        lambda: bera.bex_add_liquidity(
+            wallet, share_of(token_balance(bera.weth_contract)),
+            weth_pool_liquidity_address, weth_address,
+        ),
+        depends_on=["swap_bera_to_weth"],
+    )
+    pipeline.add(
+        "mint_honey",
+        lambda: bera.honey_mint(
+            wallet, share_of(token_balance(bera.usdc_contract))
+        ),
+        depends_on=["swap_bera_to_usdc"],
+    )
+    pipeline.add(
+        "deposit_bend",
+        lambda: bera.bend_deposit(
+            wallet, usdc_address,
+            share_of(token_balance(bera.usdc_contract)),
+        ),
+        depends_on=["swap_bera_to_usdc"],
+    )
+    pipeline.add(
+        "redeem_honey",
+        lambda: bera.honey_redeem(
+            wallet, share_of(token_balance(bera.honey_contract))
+        ),
+        depends_on=["mint_honey"],
+    )
+    pipeline.add(
+        "honey_jar_mint",
+        lambda: bera.honey_jar_mint(wallet),
+        depends_on=["mint_honey"],
+    )
+    pipeline.add(
+        "borrow_bend",
+        lambda: bera.bend_borrow(wallet, 0.01 * 10 ** 18, weth_address),
+        depends_on=["deposit_bend"],
+    )
+    return pipeline.run()
+
+
+def swap_route(wallet, snapshot):
+    bera_balance = snapshot[wallet.address]["native"]
+    amount_in_bera_to_usdc = int(
+        random.randrange(1, 5, 1) / 10 * bera_balance
+    )
+    amount_in_bera_to_weth = int(
+        random.randrange(1, 5, 1) / 10 * bera_balance
+    )
+    bex_swap(
+        wallet,
+        wbear_address,
+        usdc_address,
+        amount_in_bera_to_usdc,
+    )
+    bex_swap(
+        wallet,
+        wbear_address,
+        weth_address,
+        amount_in_bera_to_weth,
+    )
+
+
+def liquidity_route(wallet, snapshot):
+    balances = snapshot[wallet.address]["balances"]
+    usdc_balance = int(
+        random.randrange(1, 5, 1) / 10 * balances[usdc_address]
+    )
+    add_liquidity_usdc(wallet, usdc_balance)
+
+    weth_balance = int(
+        random.randrange(1, 5, 1) / 10 * balances[weth_address]
+    )
+    add_liquidity_weth(wallet, weth_balance)
+
+
+def mint_honey_route(wallet, snapshot):
+    usdc_balance = int(
+        random.randrange(1, 5, 1)
+        / 10
+        * snapshot[wallet.address]["balances"][usdc_address]
+    )
+    mint_honey(wallet, usdc_balance)
+
+
+def redeem_honey_route(wallet, snapshot):
+    amount_honey = int(
+        random.randrange(1, 5, 1)
+        / 10
+        * snapshot[wallet.address]["balances"][honey_address]
+    )
+    redeem_honey(wallet, amount_honey)
+
+
+def deposit_bend_route(wallet, snapshot):
+    deposit_amount_usdc = int(
+        random.randrange(1, 5, 1)
+        / 10
+        * snapshot[wallet.address]["balances"][usdc_address]
+    )
+    deposit_bend(wallet, usdc_address, deposit_amount_usdc)
+
+
+def borrow_bend_route(wallet):
+    borrow_amount_weth = 0.01 * 10**18
+    borrow_bend(wallet, weth_address, borrow_amount_weth)
 
 
 def main():
@@ -303,179 +482,45 @@ def main():
         if choice == "1":
             claim_bera(wallets, proxies)
         elif choice == "2":
-            for wallet_key in wallets:
-                account = Account.from_key(wallet_key.strip())
-                bera_balance = bera.w3.eth.get_balance(account.address)
-                amount_in_bera_to_usdc = int(
-                    random.randrange(1, 3, 1) / 10 * bera_balance
-                )
-                amount_in_bera_to_weth = int(
-                    random.randrange(1, 3, 1) / 10 * bera_balance
-                )
-
-                bex_swap(
-                    wallet_key, wbear_address, usdc_address, amount_in_bera_to_usdc
-                )
-                time.sleep(5)
-                bex_swap(
-                    wallet_key, wbear_address, weth_address, amount_in_bera_to_weth
-                )
-
-                usdc_balance = int(
-                    random.randrange(1, 3, 1)
-                    / 10
-                    * bera.usdc_contract.functions.balanceOf(account.address).call()
-                )
-                weth_balance = int(
-                    random.randrange(1, 3, 1)
-                    / 10
-                    * bera.weth_contract.functions.balanceOf(account.address).call()
-                )
-
-                add_liquidity_usdc(wallet_key, usdc_balance)
-                time.sleep(5)
-                add_liquidity_weth(wallet_key, weth_balance)
-
-                usdc_balance = int(
-                    random.randrange(1, 3, 1)
-                    / 10
-                    * bera.usdc_contract.functions.balanceOf(account.address).call()
-                )
-
-                mint_honey(wallet_key, usdc_balance)
-                time.sleep(5)
-
-                amount_honey = int(
-                    random.randrange(1, 3, 1)
-                    / 10
-                    * bera.honey_contract.functions.balanceOf(account.address).call()
-                )
-                redeem_honey(wallet_key, amount_honey)
-
-                time.sleep(5)
-                deposit_amount_usdc = int(
-                    random.randrange(1, 3, 1)
-                    / 10
-                    * bera.usdc_contract.functions.balanceOf(account.address).call()
-                )
-                deposit_bend(wallet_key, usdc_address, deposit_amount_usdc)
-
-                time.sleep(5)
-                borrow_amount_weth = 0.01 * 10 ** 18
-                borrow_bend(wallet_key, weth_address, borrow_amount_weth)
-
-                time.sleep(5)
-                honey_jar_mint(wallet_key)
-
-                time.sleep(5)
-                deploy_contract(wallet_key)
-
-                time.sleep(5)
-                bera_name(wallet_key)
+            executor.run(base_route, wallets)
 
         elif choice == "3":
             while True:
                 choose_activity_menu()
                 activity_choice = input("Enter activity choice for wallets: ")
                 if activity_choice == "1":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        bera_balance = bera.w3.eth.get_balance(account.address)
-                        amount_in_bera_to_usdc = int(
-                            random.randrange(1, 5, 1) / 10 * bera_balance
-                        )
-                        amount_in_bera_to_weth = int(
-                            random.randrange(1, 5, 1) / 10 * bera_balance
-                        )
-                        bex_swap(
-                            wallet_key,
-                            wbear_address,
-                            usdc_address,
-                            amount_in_bera_to_usdc,
-                        )
-                        time.sleep(3)
-                        bex_swap(
-                            wallet_key,
-                            wbear_address,
-                            weth_address,
-                            amount_in_bera_to_weth,
-                        )
+                    snapshot = snapshot_wallets()
+                    executor.run(partial(swap_route, snapshot=snapshot), wallets)
 
                 elif activity_choice == "2":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        usdc_balance = int(
-                            random.randrange(1, 5, 1)
-                            / 10
-                            * bera.usdc_contract.functions.balanceOf(
-                                account.address
-                            ).call()
-                        )
-                        add_liquidity_usdc(wallet_key, usdc_balance)
-
-                        time.sleep(3)
-                        weth_balance = int(
-                            random.randrange(1, 5, 1)
-                            / 10
-                            * bera.weth_contract.functions.balanceOf(
-                                account.address
-                            ).call()
-                        )
-                        add_liquidity_weth(wallet_key, weth_balance)
+                    snapshot = snapshot_wallets(
+                        [usdc_address, weth_address], [bex_approve_liquidity_address]
+                    )
+                    executor.run(partial(liquidity_route, snapshot=snapshot), wallets)
 
                 elif activity_choice == "3":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        usdc_balance = int(
-                            random.randrange(1, 5, 1)
-                            / 10
-                            * bera.usdc_contract.functions.balanceOf(
-                                account.address
-                            ).call()
-                        )
-                        mint_honey(wallet_key, usdc_balance)
+                    snapshot = snapshot_wallets([usdc_address], [honey_swap_address])
+                    executor.run(partial(mint_honey_route, snapshot=snapshot), wallets)
 
                 elif activity_choice == "4":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        amount_honey = int(
-                            random.randrange(1, 5, 1)
-                            / 10
-                            * bera.honey_contract.functions.balanceOf(
-                                account.address
-                            ).call()
-                        )
-                        redeem_honey(wallet_key, amount_honey)
+                    snapshot = snapshot_wallets([honey_address], [honey_swap_address])
+                    executor.run(partial(redeem_honey_route, snapshot=snapshot), wallets)
 
                 elif activity_choice == "5":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        deposit_amount_usdc = int(
-                            random.randrange(1, 5, 1)
-                            / 10
-                            * bera.usdc_contract.functions.balanceOf(
-                                account.address
-                            ).call()
-                        )
-                        deposit_bend(wallet_key, usdc_address, deposit_amount_usdc)
+                    snapshot = snapshot_wallets([usdc_address], [bend_address])
+                    executor.run(partial(deposit_bend_route, snapshot=snapshot), wallets)
 
                 elif activity_choice == "6":
-                    for wallet_key in wallets:
-                        account = Account.from_key(wallet_key.strip())
-                        borrow_amount_weth = 0.01 * 10**18
-                        borrow_bend(wallet_key, weth_address, borrow_amount_weth)
+                    executor.run(borrow_bend_route, wallets)
 
                 elif activity_choice == "7":
-                    for wallet_key in wallets:
-                        honey_jar_mint(wallet_key)
+                    bulk_route("Minting Honey Jar", bera.bulk_honey_jar_mint)
 
                 elif activity_choice == "8":
-                    for wallet_key in wallets:
-                        deploy_contract(wallet_key)
+                    bulk_route("Deploying contract", bera.bulk_deploy_contract)
 
                 elif activity_choice == "9":
-                    for wallet_key in wallets:
-                        bera_name(wallet_key)
+                    bulk_route("Creating bera name", bera.bulk_create_bera_name)
 
                 elif activity_choice == "10":
                     break
@@ -490,4 +535,5 @@ def main():
 
 
 if __name__ == "__main__":
+    setup()
     main()
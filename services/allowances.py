@@ -0,0 +1,84 @@
+import atexit
+import json
+import os
+import threading
+import time
+
+from loguru import logger
+
+from config.config import cache_dir, allowance_cache_save_interval
+
+MAX_UINT256 = 2**256 - 1
+INFINITE_ALLOWANCE = 2**255
+
+
+class AllowanceCache:
+    def __init__(self, chain_id, path=None):
+        self.chain_id = chain_id
+        self.path = path or os.path.join(cache_dir, "allowances.json")
+        self.hits = 0
+        self.misses = 0
+        self._approved = set()
+        self._dirty = False
+        self._saved_at = 0
+        self._lock = threading.Lock()
+        self._load()
+        atexit.register(self.flush)
+
+    def _key(self, owner, token, spender):
+        return f"{self.chain_id}:{owner}:{token}:{spender}".lower()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._approved = set(json.load(f))
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            logger.warning(f"Broken allowance cache {self.path}, starting empty")
+
+    def _save(self):
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(sorted(self._approved), f)
+        os.replace(temp_path, self.path)
+
+    def is_approved(self, owner, token, spender):
+        with self._lock:
+            if self._key(owner, token, spender) in self._approved:
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def mark_approved(self, owner, token, spender):
+        key = self._key(owner, token, spender)
+        with self._lock:
+            if key not in self._approved:
+                self._approved.add(key)
+                self._dirty = True
+                if time.monotonic() - self._saved_at >= allowance_cache_save_interval:
+                    self._save()
+
+    def flush(self):
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def record(self, owner, token, spender, allowance):
+        if allowance is None:
+            return
+        if allowance >= INFINITE_ALLOWANCE:
+            self.mark_approved(owner, token, spender)
+        else:
+            self.forget(owner, token, spender)
+
+    def forget(self, owner, token, spender):
+        key = self._key(owner, token, spender)
+        with self._lock:
+            if key in self._approved:
+                self._approved.discard(key)
+                self._dirty = True
@@ -0,0 +1,444 @@
+import asyncio
+import os
+from functools import cached_property
+
+import requests
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from eth_abi import decode_abi
+from loguru import logger
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types
+from web3.eth import AsyncEth
+from web3.providers.async_rpc import AsyncHTTPProvider
+
+from config.config import rpc_urls, cache_dir, weth_bytecode, fee_history_blocks, max_workers
+from config.abi import bex_quote_abi, erc_20_read_abi, ooga_booga_read_abi
+from config.contracts_addresses import (
+    bex_swap_address,
+    usdc_address,
+    honey_address,
+    honey_swap_address,
+    bex_approve_liquidity_address,
+    bend_address,
+    wbear_address,
+    zero_address,
+    ooga_booga_address,
+    bera_name_address
+)
+from services.allowances import AllowanceCache, INFINITE_ALLOWANCE, MAX_UINT256
+from services import encoder
+from services.compiler import ContractCompiler
+from services.contracts import ContractRegistry, checksum
+from services.gas import GasPriceOracle
+from services.gas_profiler import GasProfiler
+from services.nonce_manager import NonceManager
+from services.quoter import SwapQuoter
+from services.receipts import ReceiptTracker
+from services.rpc_pool import RPCPool, pin
+from services.settlement import Settlement
+from services.transaction_template import TransactionTemplate
+
+HONEY_JAR_PRICE = int(4.2 * 10**18)
+
+
+class PooledAsyncHTTPProvider(AsyncHTTPProvider):
+    def __init__(self, endpoint_uri, session, request_kwargs=None):
+        super().__init__(endpoint_uri, request_kwargs)
+        self.session = session
+
+    async def make_request(self, method, params):
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault("timeout", ClientTimeout(10))
+        async with self.session.post(
+            self.endpoint_uri, data=self.encode_rpc_request(method, params), **request_kwargs
+        ) as response:
+            response.raise_for_status()
+            return self.decode_rpc_response(await response.read())
+
+
+class AsyncBeraChain:
+    def __init__(
+        self, rpc_urls=rpc_urls, session=None, connection_limit=max_workers, cache_dir=cache_dir
+    ):
+        self.rpc_urls = list(rpc_urls)
+        self.cache_dir = cache_dir
+        self.session = session
+        self.connection_limit = connection_limit
+        self.providers = {}
+        self.w3 = None
+        self.chain_id = None
+        self.template = None
+        self._owns_session = session is None
+        self._fees_lock = None
+        self.compiler = ContractCompiler(cache_dir)
+        self.sync_w3 = Web3(RPCPool(self.rpc_urls))
+        self.contracts = ContractRegistry(self.sync_w3)
+        self.nonce_manager = NonceManager(self.sync_w3)
+        self.gas_oracle = GasPriceOracle(self.sync_w3)
+        self.profiler = GasProfiler(os.path.join(cache_dir, "gas_profile.json"))
+        self.receipts = ReceiptTracker(self.sync_w3)
+        self.allowances = None
+        self.settlement = None
+        self.ooga_booga_contract = self.contracts.get(ooga_booga_address, ooga_booga_read_abi)
+
+    @cached_property
+    def faker(self):
+        from faker import Faker
+
+        return Faker("en_US")
+
+    @cached_property
+    def quoter(self):
+        return SwapQuoter(self.sync_w3, self.contracts.get(bex_swap_address, bex_quote_abi))
+
+    @cached_property
+    def router_session(self):
+        return requests.Session()
+
+    async def __aenter__(self):
+        self._fees_lock = asyncio.Lock()
+        if self.session is None:
+            self.session = ClientSession(
+                connector=TCPConnector(limit=self.connection_limit)
+            )
+        self.providers = {
+            url: Web3(
+                PooledAsyncHTTPProvider(url, self.session),
+                modules={"eth": (AsyncEth,)},
+                middlewares=[],
+            )
+            for url in self.rpc_urls
+        }
+        self.w3 = self.providers[self.rpc_urls[0]]
+        try:
+            self.chain_id = await self.w3.eth.chain_id
+        except Exception:
+            await self.close()
+            raise ValueError(
+                "Wrong RPC. Recommended RPC: https://rpc.ankr.com/berachain_testnet"
+            )
+        self.template = TransactionTemplate(
+            self.w3, self.gas_oracle, self.nonce_manager, self.profiler, chain_id=self.chain_id
+        )
+        self.allowances = AllowanceCache(
+            self.chain_id, os.path.join(self.cache_dir, "allowances.json")
+        )
+        self.settlement = Settlement(
+            self.receipts, self.nonce_manager, self.profiler, self.allowances
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def w3_for(self, address):
+        return self.providers[pin(address, self.rpc_urls)]
+
+    def token_contract(self, address):
+        return self.contracts.get(address, erc_20_read_abi)
+
+    async def call(self, address, function):
+        result = await self.w3_for(address).eth.call(
+            {"to": function.address, "data": function._encode_transaction_data()}
+        )
+        values = decode_abi(get_abi_output_types(function.abi), result)
+        return values[0] if len(values) == 1 else values
+
+    async def balance_of(self, wallet, token_address):
+        return await self.call(
+            wallet.address, self.token_contract(token_address).functions.balanceOf(wallet.address)
+        )
+
+    async def get_nonce(self, address):
+        nonce = self.nonce_manager.take(address)
+        while nonce is None:
+            self.nonce_manager.seed(
+                address,
+                await self.w3_for(address).eth.get_transaction_count(address, "pending"),
+            )
+            nonce = self.nonce_manager.take(address)
+        return nonce
+
+    async def fee_source(self, name):
+        if name == "fee_history":
+            return await self.w3.eth.fee_history(
+                fee_history_blocks, "latest", self.gas_oracle.percentiles
+            )
+        return await self.w3.eth.gas_price
+
+    async def fees(self, action="default"):
+        async with self._fees_lock:
+            results = {}
+            name = self.gas_oracle.missing(results)
+            while name is not None:
+                try:
+                    result = await self.fee_source(name)
+                except Exception as e:
+                    self.gas_oracle.receive(results, name, error=e)
+                else:
+                    self.gas_oracle.receive(results, name, result)
+                name = self.gas_oracle.missing(results)
+            return self.gas_oracle.fees_from(results, action)
+
+    async def build(self, action, address, to, data, value=0, pool=None):
+        gas = self.template.gas_limit(action, pool)
+        fees = await self.fees(action)
+        nonce = await self.get_nonce(address)
+        return encoder.transaction(to, data, self.chain_id, nonce, gas, fees, value=value)
+
+    async def send_transaction(
+        self, wallet, txn, action=None, pool=None, approves=None, spends=None
+    ):
+        for attempt in range(2):
+            try:
+                signed_txn = wallet.signer.sign_transaction(txn)
+                order_hash = await self.w3_for(wallet.address).eth.send_raw_transaction(
+                    signed_txn.rawTransaction
+                )
+                order_hash = order_hash.hex()
+                self.settlement.track(
+                    wallet.address, order_hash, action, pool, txn["gas"], approves, spends
+                )
+                return order_hash
+            except Exception as e:
+                self.nonce_manager.resync(wallet.address)
+                if attempt or not NonceManager.is_nonce_error(e):
+                    raise
+                logger.warning(f"Nonce conflict for {wallet.address}, resending: {e}")
+                txn["nonce"] = await self.get_nonce(wallet.address)
+
+    async def send_approve(self, wallet, spender, amount, token_address):
+        txn = await self.build(
+            "approve_token", wallet.address, token_address, encoder.approve(spender, amount)
+        )
+        approves = (token_address, spender) if amount >= INFINITE_ALLOWANCE else None
+        return await self.send_transaction(wallet, txn, "approve_token", approves=approves)
+
+    async def ensure_allowance(self, wallet, token_address, spender, amount):
+        if self.allowances.is_approved(wallet.address, token_address, spender):
+            return True
+        allowance_balance = await self.call(
+            wallet.address,
+            self.token_contract(token_address).functions.allowance(wallet.address, spender),
+        )
+        self.allowances.record(wallet.address, token_address, spender, allowance_balance)
+        if allowance_balance >= amount:
+            return True
+        approve_result = await self.send_approve(
+            wallet, spender, MAX_UINT256, token_address
+        )
+        logger.debug(approve_result)
+        return approve_result
+
+    async def bex_swap(
+        self,
+        wallet,
+        asset_in_address,
+        asset_out_address,
+        amount_in,
+        fake,
+    ):
+        if asset_in_address == wbear_address:
+            balance = await self.w3_for(wallet.address).eth.get_balance(wallet.address)
+        else:
+            balance = await self.balance_of(wallet, asset_in_address)
+        if balance == 0:
+            return "ERR: Bera balance is 0. Try again."
+        if asset_in_address != wbear_address:
+            try:
+                await self.ensure_allowance(
+                    wallet, asset_in_address, bex_swap_address, amount_in
+                )
+            except Exception:
+                return "ERR: Something went wrong with allowance. Try again."
+
+        swaps_list = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self.quoter.quote,
+            asset_in_address,
+            asset_out_address,
+            amount_in,
+            fake,
+            self.router_session,
+        )
+        swaps = list()
+        for index, info in enumerate(swaps_list):
+            swaps.append(
+                dict(
+                    poolId=checksum(info["pool"]),
+                    assetIn=checksum(info["assetIn"]),
+                    amountIn=int(info["amountIn"]),
+                    assetOut=checksum(info["assetOut"]),
+                    amountOut=0
+                    if index + 1 != len(swaps_list)
+                    else int(int(info["amountOut"]) * 0.5),
+                    userData=b"",
+                )
+            )
+        if asset_in_address.lower() == wbear_address.lower():
+            swaps[0]["assetIn"] = zero_address
+
+        txn = await self.build(
+            "bex_swap",
+            wallet.address,
+            bex_swap_address,
+            encoder.batch_swap(swaps, deadline=99999999),
+            value=amount_in if asset_in_address == wbear_address else 0,
+            pool=swaps[0]["poolId"],
+        )
+        return await self.send_transaction(
+            wallet,
+            txn,
+            "bex_swap",
+            swaps[0]["poolId"],
+            spends=(
+                None if asset_in_address == wbear_address else (asset_in_address, bex_swap_address)
+            ),
+        )
+
+    async def bex_add_liquidity(
+        self, wallet, amount_to_spend: int, pool_address, asset_in_address
+    ) -> str:
+        token_balance = await self.balance_of(wallet, asset_in_address)
+        assert token_balance != 0
+        assert token_balance >= amount_to_spend
+        await self.ensure_allowance(
+            wallet,
+            asset_in_address,
+            bex_approve_liquidity_address,
+            amount_to_spend,
+        )
+        txn = await self.build(
+            "bex_add_liquidity",
+            wallet.address,
+            bex_swap_address,
+            encoder.add_liquidity(
+                pool_address, wallet.address, [asset_in_address], [amount_to_spend]
+            ),
+            pool=pool_address,
+        )
+        return await self.send_transaction(
+            wallet,
+            txn,
+            "bex_add_liquidity",
+            pool_address,
+            spends=(asset_in_address, bex_approve_liquidity_address),
+        )
+
+    async def honey_mint(self, wallet, amount_usdc: int) -> str:
+        usdc_balance = await self.balance_of(wallet, usdc_address)
+        assert usdc_balance != 0
+        assert usdc_balance >= amount_usdc
+        await self.ensure_allowance(
+            wallet, usdc_address, honey_swap_address, amount_usdc
+        )
+        txn = await self.build(
+            "honey_mint",
+            wallet.address,
+            honey_swap_address,
+            encoder.honey_mint(wallet.address, usdc_address, amount_usdc),
+        )
+        return await self.send_transaction(
+            wallet, txn, "honey_mint", spends=(usdc_address, honey_swap_address)
+        )
+
+    async def honey_redeem(self, wallet, amount_honey_in: int) -> str:
+        honey_balance = await self.balance_of(wallet, honey_address)
+        assert honey_balance != 0
+        assert honey_balance >= amount_honey_in
+        try:
+            await self.ensure_allowance(
+                wallet, honey_address, honey_swap_address, amount_honey_in
+            )
+        except Exception:
+            return "ERR: Something went wrong with allowance. Try again."
+        txn = await self.build(
+            "honey_redeem",
+            wallet.address,
+            honey_swap_address,
+            encoder.honey_redeem(wallet.address, amount_honey_in, usdc_address),
+        )
+        return await self.send_transaction(
+            wallet, txn, "honey_redeem", spends=(honey_address, honey_swap_address)
+        )
+
+    async def bend_deposit(
+        self, wallet, amount_in_token_address, amount_in: int
+    ) -> str:
+        token_balance = await self.balance_of(wallet, amount_in_token_address)
+        assert token_balance != 0
+        assert token_balance >= amount_in
+        try:
+            await self.ensure_allowance(
+                wallet, amount_in_token_address, bend_address, amount_in
+            )
+        except Exception:
+            return "ERR: Something went wrong with allowance. Try again."
+        txn = await self.build(
+            "bend_deposit",
+            wallet.address,
+            bend_address,
+            encoder.bend_supply(amount_in_token_address, amount_in, wallet.address),
+        )
+        return await self.send_transaction(
+            wallet, txn, "bend_deposit", spends=(amount_in_token_address, bend_address)
+        )
+
+    async def bend_borrow(
+        self, wallet, amount_out: int, asset_token_address
+    ) -> str:
+        txn = await self.build(
+            "bend_borrow",
+            wallet.address,
+            bend_address,
+            encoder.bend_borrow(
+                asset_token_address, int(amount_out), 2, 0, wallet.address
+            ),
+        )
+        return await self.send_transaction(wallet, txn, "bend_borrow")
+
+    async def honey_jar_mint(self, wallet):
+        try:
+            await self.ensure_allowance(
+                wallet, honey_address, ooga_booga_address, HONEY_JAR_PRICE
+            )
+        except Exception:
+            return "ERR: Something went wrong with allowance. Try again."
+        if await self.call(
+            wallet.address, self.ooga_booga_contract.functions.hasMinted(wallet.address)
+        ):
+            return True
+        txn = await self.build(
+            "honey_jar_mint", wallet.address, ooga_booga_address, encoder.buy()
+        )
+        return await self.send_transaction(
+            wallet, txn, "honey_jar_mint", spends=(honey_address, ooga_booga_address)
+        )
+
+    async def deploy_contract(self, wallet):
+        bytecode = weth_bytecode
+        if not bytecode:
+            artifact = await asyncio.get_running_loop().run_in_executor(
+                None, self.compiler.compile, "config/WETH.sol", "0.4.18"
+            )
+            bytecode = artifact["bin"]
+        txn = await self.build("deploy_contract", wallet.address, None, bytecode)
+        return await self.send_transaction(wallet, txn, "deploy_contract")
+
+    async def create_bera_name(self, wallet):
+        name = self.faker.name().replace(" ", "").strip()
+        txn = await self.build(
+            "create_bera_name",
+            wallet.address,
+            bera_name_address,
+            encoder.mint_native(
+                list(name), 1, wallet.address, "https://beranames.com/api/metadata/69", wallet.address
+            ),
+            value=int(608614232209737),
+        )
+        return await self.send_transaction(wallet, txn, "create_bera_name")
@@ -0,0 +1,128 @@
+import threading
+import time
+
+from eth_utils import to_bytes
+from web3 import HTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde
+from web3._utils.request import make_post_request
+
+from config.config import rpc_batch_window, rpc_batch_size
+
+BATCHABLE_METHODS = {
+    "eth_call",
+    "eth_getBalance",
+    "eth_getTransactionCount",
+    "eth_gasPrice",
+    "eth_chainId",
+    "eth_blockNumber",
+    "eth_getTransactionReceipt",
+}
+
+
+class PendingRequest:
+    __slots__ = ("method", "params", "response", "error", "done")
+
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.response = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    def __init__(
+        self,
+        endpoint_uri=None,
+        request_kwargs=None,
+        session=None,
+        window=rpc_batch_window,
+        max_size=rpc_batch_size,
+    ):
+        super().__init__(endpoint_uri, request_kwargs, session)
+        self.window = window
+        self.max_size = max_size
+        self.batches_sent = 0
+        self.requests_batched = 0
+        self._pending = []
+        self._lock = threading.Lock()
+
+    def make_request(self, method, params):
+        if method not in BATCHABLE_METHODS or self.max_size <= 1:
+            return super().make_request(method, params)
+        request = PendingRequest(method, params)
+        with self._lock:
+            batch = self._pending
+            batch.append(request)
+            is_leader = len(batch) == 1
+            if len(batch) >= self.max_size:
+                self._pending = []
+            else:
+                batch = None
+        if batch is not None:
+            self._flush(batch)
+        elif is_leader:
+            time.sleep(self.window)
+            with self._lock:
+                batch = self._pending if self._pending and self._pending[0] is request else None
+                if batch is not None:
+                    self._pending = []
+            if batch is not None:
+                self._flush(batch)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def make_batch_request(self, calls):
+        if not calls:
+            return []
+        payload = []
+        for method, params in calls:
+            payload.append(
+                {
+                    "jsonrpc": "2.0",
+                    "method": method,
+                    "params": params or [],
+                    "id": next(self.request_counter),
+                }
+            )
+        raw_response = make_post_request(
+            self.endpoint_uri,
+            to_bytes(text=FriendlyJsonSerde().json_encode(payload)),
+            **self.get_request_kwargs()
+        )
+        response = self.decode_rpc_response(raw_response)
+        self.batches_sent += 1
+        self.requests_batched += len(payload)
+        if not isinstance(response, list):
+            raise ValueError(f"Batch request rejected by {self.endpoint_uri}: {response}")
+        by_id = {item.get("id"): item for item in response}
+        return [
+            by_id.get(
+                request["id"],
+                {
+                    "jsonrpc": "2.0",
+                    "id": request["id"],
+                    "error": {"code": -32603, "message": "Missing response in batch"},
+                },
+            )
+            for request in payload
+        ]
+
+    def _flush(self, batch):
+        try:
+            if len(batch) == 1:
+                responses = [super().make_request(batch[0].method, batch[0].params)]
+            else:
+                responses = self.make_batch_request(
+                    [(request.method, request.params) for request in batch]
+                )
+            for request, response in zip(batch, responses):
+                request.response = response
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
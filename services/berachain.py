@@ -1,21 +1,19 @@
 import json
-import random
-import time
+import os
+from functools import cached_property
 
 import requests
-from faker import Faker
 from loguru import logger
-from solcx import set_solc_version, install_solc, compile_source
 from web3 import Web3
 
-from config.config import rpc_url
+from config.config import rpc_urls, cache_dir, metrics_path, weth_bytecode
 from config.abi import (
-    erc_20_abi,
+    erc_20_read_abi,
     honey_abi,
-    bex_abi,
+    bex_quote_abi,
     bend_abi,
     bend_borrows_abi,
-    ooga_booga_abi,
+    ooga_booga_read_abi,
     bera_name_abi
 )
 
@@ -33,46 +31,180 @@ from config.contracts_addresses import (
     ooga_booga_address,
     bera_name_address
 )
+from services.allowances import AllowanceCache, INFINITE_ALLOWANCE, MAX_UINT256
+from services.broadcaster import Broadcaster
+from services import encoder
+from services.compiler import ContractCompiler
+from services.contracts import ContractRegistry, checksum
+from services.gas import GasPriceOracle
+from services.gas_profiler import GasProfiler
+from services.metrics import Metrics, timed
+from services.multicall import Multicall, encode_call
+from services.nonce_manager import NonceManager
+from services.quoter import SwapQuoter
+from services.receipts import ReceiptTracker
+from services.rpc_pool import RPCPool
+from services.settlement import Settlement
+from services.signer import BulkSigner
+from services.transaction_template import TransactionTemplate
+
+HONEY_JAR_PRICE = int(4.2 * 10**18)
+HAS_MINTED_SELECTOR = encoder.function("hasMinted(address)")[0]
 
 
 class BeraChain:
-    def __init__(self):
-        self.rpc_url = rpc_url
+    def __init__(self, rpc_urls=rpc_urls, cache_dir=cache_dir, metrics_path=metrics_path):
+        self.metrics = Metrics(metrics_path)
         try:
-            self.w3 = Web3(Web3.HTTPProvider(self.rpc_url))
-            self.bex_contract = self.w3.eth.contract(
-                address=bex_swap_address, abi=bex_abi
-            )
-            self.honey_swap_contract = self.w3.eth.contract(
-                address=honey_swap_address, abi=honey_abi
-            )
-            self.usdc_contract = self.w3.eth.contract(
-                address=usdc_address, abi=erc_20_abi
-            )
-            self.weth_contract = self.w3.eth.contract(
-                address=weth_address, abi=erc_20_abi
+            self.rpc = RPCPool(rpc_urls, metrics=self.metrics)
+            self.metrics.gauge("rpc", self.rpc.stats, labels=("url", None, "limiter"))
+            self.metrics.gauge("rpc_failovers", lambda: self.rpc.failovers)
+            self.w3 = Web3(self.rpc)
+            self.w3.middleware_onion.inject(self.metrics.middleware, layer=0)
+            self.contracts = ContractRegistry(self.w3)
+            self.nonce_manager = NonceManager(self.w3)
+            self.compiler = ContractCompiler(cache_dir)
+            self.gas_oracle = GasPriceOracle(self.w3)
+            self.metrics.gauge("gas_oracle", self.gas_oracle.stats)
+            self.profiler = GasProfiler(os.path.join(cache_dir, "gas_profile.json"))
+            self.template = TransactionTemplate(
+                self.w3, self.gas_oracle, self.nonce_manager, self.profiler
             )
-            self.honey_contract = self.w3.eth.contract(
-                address=honey_address, abi=erc_20_abi
+            self.multicall = Multicall(self.w3)
+            self.receipts = ReceiptTracker(self.w3)
+            self.allowances = AllowanceCache(
+                self.template.chain_id, os.path.join(cache_dir, "allowances.json")
             )
-            self.bend_contract = self.w3.eth.contract(
-                address=bend_address, abi=bend_abi
+            self.settlement = Settlement(
+                self.receipts, self.nonce_manager, self.profiler, self.allowances
             )
-            self.bend_borrows_contract = self.w3.eth.contract(
-                address=bend_borrows_address, abi=bend_borrows_abi
-            )
-            self.ooga_booga_contract = self.w3.eth.contract(
-                address=ooga_booga_address, abi=ooga_booga_abi
-            )
-            self.bera_name_contract = self.w3.eth.contract(address=bera_name_address, abi=bera_name_abi)
+            self.signer = BulkSigner()
+            self.broadcaster = Broadcaster(self.w3)
         except:
             raise ValueError(
                 "Wrong RPC. Recommended RPC: https://rpc.ankr.com/berachain_testnet"
             )
 
+    @cached_property
+    def bex_contract(self):
+        return self.contracts.get(bex_swap_address, bex_quote_abi)
+
+    @cached_property
+    def honey_swap_contract(self):
+        return self.contracts.get(honey_swap_address, honey_abi)
+
+    @cached_property
+    def usdc_contract(self):
+        return self.contracts.get(usdc_address, erc_20_read_abi)
+
+    @cached_property
+    def weth_contract(self):
+        return self.contracts.get(weth_address, erc_20_read_abi)
+
+    @cached_property
+    def honey_contract(self):
+        return self.contracts.get(honey_address, erc_20_read_abi)
+
+    @cached_property
+    def bend_contract(self):
+        return self.contracts.get(bend_address, bend_abi)
+
+    @cached_property
+    def bend_borrows_contract(self):
+        return self.contracts.get(bend_borrows_address, bend_borrows_abi)
+
+    @cached_property
+    def ooga_booga_contract(self):
+        return self.contracts.get(ooga_booga_address, ooga_booga_read_abi)
+
+    @cached_property
+    def bera_name_contract(self):
+        return self.contracts.get(bera_name_address, bera_name_abi)
+
+    @cached_property
+    def quoter(self):
+        return SwapQuoter(self.w3, self.bex_contract, metrics=self.metrics)
+
+    @cached_property
+    def faker(self):
+        from faker import Faker
+
+        return Faker("en_US")
+
     def get_nonce(self, address):
-        return self.w3.eth.get_transaction_count(address)
+        return self.nonce_manager.get_nonce(address)
+
+    @timed()
+    def snapshot_accounts(self, addresses, tokens=(), spenders=()):
+        snapshot = self.multicall.snapshot_accounts(addresses, tokens, spenders)
+        for address, account in snapshot.items():
+            for (token, spender), allowance in account["allowances"].items():
+                self.allowances.record(address, token, spender, allowance)
+        return snapshot
+
+    @timed()
+    def send_transaction(
+        self, wallet, txn, action=None, pool=None, approves=None, spends=None
+    ):
+        for attempt in range(2):
+            try:
+                signed_txn = wallet.signer.sign_transaction(txn)
+                with self.rpc.pinned(wallet.address):
+                    order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction).hex()
+                self.settlement.track(
+                    wallet.address, order_hash, action, pool, txn["gas"], approves, spends
+                )
+                return order_hash
+            except Exception as e:
+                self.nonce_manager.resync(wallet.address)
+                if attempt or not self.nonce_manager.is_nonce_error(e):
+                    raise
+                logger.warning(f"Nonce conflict for {wallet.address}, resending: {e}")
+                txn["nonce"] = self.get_nonce(wallet.address)
+
+    @timed()
+    def send_bulk(self, jobs, action=None, approves=None, spends=None):
+        try:
+            with self.metrics.timer("sign.bulk"):
+                signed = self.signer.sign(jobs)
+        except Exception:
+            for wallet, _ in jobs:
+                self.nonce_manager.resync(wallet.address)
+            raise
+        results = self.broadcaster.broadcast(
+            [raw_transaction for raw_transaction, _ in signed],
+            [wallet.address for wallet, _ in jobs],
+        )
+        order_hashes = []
+        for (wallet, txn), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                self.nonce_manager.resync(wallet.address)
+                order_hashes.append(f"ERR: {str(result)}")
+                continue
+            self.settlement.track(
+                wallet.address, result, action, None, txn["gas"], approves, spends
+            )
+            order_hashes.append(result)
+        return order_hashes
+
+    def bulk(self, wallets, action, build, approves=None, spends=None):
+        self.nonce_manager.prefetch([wallet.address for wallet in wallets])
+        results = [None] * len(wallets)
+        jobs = []
+        indexes = []
+        for index, wallet in enumerate(wallets):
+            try:
+                jobs.append((wallet, build(wallet)))
+                indexes.append(index)
+            except Exception as e:
+                self.nonce_manager.resync(wallet.address)
+                results[index] = f"ERR: {str(e)}"
+        if jobs:
+            for index, order_hash in zip(indexes, self.send_bulk(jobs, action, approves, spends)):
+                results[index] = order_hash
+        return results
 
+    @timed()
     def claim_bera_from_faucet(self, address, twocaptcha, fake, proxy):
         turnstile = twocaptcha.get_2captcha_turnstile_token()
         if not turnstile:
@@ -107,35 +239,48 @@ class BeraChain:
         except requests.exceptions.RequestException as e:
             print("Error occurred:", e)
             return None
-    def approve_token(
-        self, address, private_key, spender, amount: int, approve_token_address
-    ):
-        approve_contract = self.w3.eth.contract(
-            address=approve_token_address, abi=erc_20_abi
+
+    def approve_txn(self, wallet, spender, amount: int, approve_token_address):
+        return self.template.build(
+            "approve_token",
+            wallet.address,
+            approve_token_address,
+            encoder.approve(spender, amount),
         )
 
-        allowance_balance = approve_contract.functions.allowance(
-            address, spender
-        ).call()
-        if allowance_balance < amount:
-            txn = approve_contract.functions.approve(spender, amount).buildTransaction(
-                {
-                    "gas": 500000 + random.randint(1, 10000),
-                    "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                    "nonce": self.get_nonce(address),
-                }
-            )
-            signed_txn = self.w3.eth.account.signTransaction(
-                txn, private_key=private_key.strip()
-            )
-            order_hash = self.w3.eth.sendRawTransaction(signed_txn.rawTransaction)
-            return order_hash.hex()
-        return True
+    def send_approve(self, wallet, spender, amount: int, approve_token_address):
+        txn = self.approve_txn(wallet, spender, amount, approve_token_address)
+        approves = (approve_token_address, spender) if amount >= INFINITE_ALLOWANCE else None
+        return self.send_transaction(wallet, txn, "approve_token", approves=approves)
+
+    def bulk_approve(self, wallets, spender, approve_token_address):
+        return self.bulk(
+            wallets,
+            "approve_token",
+            lambda wallet: self.approve_txn(wallet, spender, MAX_UINT256, approve_token_address),
+            approves=(approve_token_address, spender),
+        )
 
+    @timed()
+    def ensure_allowance(self, wallet, token_address, spender, amount: int):
+        if self.allowances.is_approved(wallet.address, token_address, spender):
+            return True
+        allowance_balance = self.contracts.get(
+            token_address, erc_20_read_abi
+        ).functions.allowance(wallet.address, spender).call()
+        self.allowances.record(
+            wallet.address, token_address, spender, allowance_balance
+        )
+        if allowance_balance >= amount:
+            return True
+        approve_result = self.send_approve(wallet, spender, MAX_UINT256, token_address)
+        logger.debug(approve_result)
+        return approve_result
+
+    @timed()
     def bex_swap(
         self,
-        spender,
-        private_key,
+        wallet,
         asset_in_address,
         asset_out_address,
         amount_in,
@@ -143,66 +288,34 @@ class BeraChain:
         session,
     ):
         if asset_in_address == wbear_address:
-            balance = self.w3.eth.get_balance(spender)
+            balance = self.w3.eth.get_balance(wallet.address)
             if balance == 0:
                 return "ERR: Bera balance is 0. Try again."
         else:
-            asset_in_token_contract = self.w3.eth.contract(
-                asset_in_address, abi=erc_20_abi
-            )
-            balance = asset_in_token_contract.functions.balanceOf(spender).call()
+            asset_in_token_contract = self.contracts.get(asset_in_address, erc_20_read_abi)
+            balance = asset_in_token_contract.functions.balanceOf(
+                wallet.address
+            ).call()
             if balance == 0:
                 return "ERR: Bera balance is 0. Try again."
-            allowance_balance = asset_in_token_contract.functions.allowance(
-                spender, bex_swap_address
-            ).call()
-            if allowance_balance < amount_in:
-                try:
-                    approve_result = self.approve_token(
-                        spender,
-                        private_key,
-                        bex_swap_address,
-                        int("0x" + "f" * 64, 16),
-                        bex_swap_address,
-                    )
-                    logger.debug(approve_result)
-                except:
-                    return "ERR: Something went wrong with allowance. Try again."
-
-        headers = {
-            "authority": "artio-80085-dex-router.berachain.com",
-            "accept": "*/*",
-            "accept-language": "zh-CN,zh;q=0.9",
-            "cache-control": "no-cache",
-            "origin": "https://artio.bex.berachain.com",
-            "pragma": "no-cache",
-            "referer": "https://artio.bex.berachain.com/",
-            "user-agent": fake.chrome(),
-        }
-
-        params = {
-            "quoteAsset": asset_out_address,
-            "baseAsset": asset_in_address,
-            "amount": amount_in,
-            "swap_type": "given_in",
-        }
+            try:
+                self.ensure_allowance(
+                    wallet, asset_in_address, bex_swap_address, amount_in
+                )
+            except:
+                return "ERR: Something went wrong with allowance. Try again."
 
-        response = session.get(
-            "https://artio-80085-dex-router.berachain.com/dex/route",
-            params=params,
-            headers=headers,
+        swaps_list = self.quoter.quote(
+            asset_in_address, asset_out_address, amount_in, fake, session
         )
-        time.sleep(1)
-        assert response.status_code == 200
-        swaps_list = response.json()["steps"]
         swaps = list()
         for index, info in enumerate(swaps_list):
             swaps.append(
                 dict(
-                    poolId=self.w3.toChecksumAddress(info["pool"]),
-                    assetIn=self.w3.toChecksumAddress(info["assetIn"]),
+                    poolId=checksum(info["pool"]),
+                    assetIn=checksum(info["assetIn"]),
                     amountIn=int(info["amountIn"]),
-                    assetOut=self.w3.toChecksumAddress(info["assetOut"]),
+                    assetOut=checksum(info["assetOut"]),
                     amountOut=0
                     if index + 1 != len(swaps_list)
                     else int(int(info["amountOut"]) * 0.5),
@@ -212,241 +325,224 @@ class BeraChain:
         if asset_in_address.lower() == wbear_address.lower():
             swaps[0]["assetIn"] = zero_address
 
-        txn = self.bex_contract.functions.batchSwap(
-            kind=0, swaps=swaps, deadline=99999999
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "value": amount_in if asset_in_address == wbear_address else 0,
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(spender),
-            }
+        txn = self.template.build(
+            "bex_swap",
+            wallet.address,
+            bex_swap_address,
+            encoder.batch_swap(swaps, deadline=99999999),
+            value=amount_in if asset_in_address == wbear_address else 0,
+            pool=swaps[0]["poolId"],
+        )
+        return self.send_transaction(
+            wallet,
+            txn,
+            "bex_swap",
+            swaps[0]["poolId"],
+            spends=(
+                None if asset_in_address == wbear_address else (asset_in_address, bex_swap_address)
+            ),
         )
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
 
+    @timed()
     def bex_add_liquidity(
-        self, spender, private_key, amount_to_spend: int, pool_address, asset_in_address
+        self, wallet, amount_to_spend: int, pool_address, asset_in_address
     ) -> str:
-        asset_in_token_contract = self.w3.eth.contract(asset_in_address, abi=erc_20_abi)
-        token_balance = asset_in_token_contract.functions.balanceOf(spender).call()
+        asset_in_token_contract = self.contracts.get(asset_in_address, erc_20_read_abi)
+        token_balance = asset_in_token_contract.functions.balanceOf(
+            wallet.address
+        ).call()
         assert token_balance != 0
         assert token_balance >= amount_to_spend
-        allowance_balance = asset_in_token_contract.functions.allowance(
-            spender, bex_approve_liquidity_address
-        ).call()
-        if allowance_balance < amount_to_spend:
-            approve_result = self.approve_token(
-                spender,
-                private_key,
-                bex_approve_liquidity_address,
-                int("0x" + "f" * 64, 16),
-                asset_in_address,
-            )
-            logger.debug(approve_result)
+        self.ensure_allowance(
+            wallet,
+            asset_in_address,
+            bex_approve_liquidity_address,
+            amount_to_spend,
+        )
 
-        txn = self.bex_contract.functions.addLiquidity(
+        txn = self.template.build(
+            "bex_add_liquidity",
+            wallet.address,
+            bex_swap_address,
+            encoder.add_liquidity(
+                pool_address, wallet.address, [asset_in_address], [amount_to_spend]
+            ),
+            pool=pool_address,
+        )
+        return self.send_transaction(
+            wallet,
+            txn,
+            "bex_add_liquidity",
             pool_address,
-            receiver=spender,
-            assetsIn=[asset_in_address],
-            amountsIn=[amount_to_spend],
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(spender),
-            }
+            spends=(asset_in_address, bex_approve_liquidity_address),
         )
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
 
-    def honey_mint(self, spender, private_key, amount_usdc: int) -> str:
-        usdc_balance = self.usdc_contract.functions.balanceOf(spender).call()
+    @timed()
+    def honey_mint(self, wallet, amount_usdc: int) -> str:
+        usdc_balance = self.usdc_contract.functions.balanceOf(wallet.address).call()
         assert usdc_balance != 0
         assert usdc_balance >= amount_usdc
-        allowance_balance = self.usdc_contract.functions.allowance(
-            spender, honey_swap_address
-        ).call()
-        if allowance_balance < amount_usdc:
-            approve_result = self.approve_token(
-                spender,
-                private_key,
-                honey_swap_address,
-                int("0x" + "f" * 64, 16),
-                usdc_address,
-            )
+        self.ensure_allowance(wallet, usdc_address, honey_swap_address, amount_usdc)
 
-        txn = self.honey_swap_contract.functions.mint(
-            spender,
-            usdc_address,
-            amount=amount_usdc,
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(spender),
-            }
+        txn = self.template.build(
+            "honey_mint",
+            wallet.address,
+            honey_swap_address,
+            encoder.honey_mint(wallet.address, usdc_address, amount_usdc),
+        )
+        return self.send_transaction(
+            wallet, txn, "honey_mint", spends=(usdc_address, honey_swap_address)
         )
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
 
-    def honey_redeem(self, address, private_key, amount_honey_in: int) -> str:
-        honey_balance = self.honey_contract.functions.balanceOf(address).call()
+    @timed()
+    def honey_redeem(self, wallet, amount_honey_in: int) -> str:
+        honey_balance = self.honey_contract.functions.balanceOf(wallet.address).call()
         assert honey_balance != 0
         assert honey_balance >= amount_honey_in
-        allowance_balance = self.honey_contract.functions.allowance(
-            address, honey_swap_address
-        ).call()
-        if allowance_balance < amount_honey_in:
-            try:
-                approve_result = self.approve_token(
-                    address,
-                    private_key,
-                    honey_swap_address,
-                    int("0x" + "f" * 64, 16),
-                    honey_address,
-                )
-
-            except:
-                return "ERR: Something went wrong with allowance. Try again."
-        txn = self.honey_swap_contract.functions.redeem(
-            to=address, amount=amount_honey_in, collateral=usdc_address
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(address),
-            }
+        try:
+            self.ensure_allowance(
+                wallet, honey_address, honey_swap_address, amount_honey_in
+            )
+        except:
+            return "ERR: Something went wrong with allowance. Try again."
+        txn = self.template.build(
+            "honey_redeem",
+            wallet.address,
+            honey_swap_address,
+            encoder.honey_redeem(wallet.address, amount_honey_in, usdc_address),
         )
-        signed_txn = self.w3.eth.account.sign_transaction(
-            txn, private_key=private_key.strip()
+        return self.send_transaction(
+            wallet, txn, "honey_redeem", spends=(honey_address, honey_swap_address)
         )
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
 
-    def bend_deposit(
-        self, address, private_key, amount_in_token_address, amount_in: int
-    ) -> str:
-        amount_in_token_contract = self.w3.eth.contract(
-            address=amount_in_token_address, abi=erc_20_abi
+    @timed()
+    def bend_deposit(self, wallet, amount_in_token_address, amount_in: int) -> str:
+        amount_in_token_contract = self.contracts.get(
+            amount_in_token_address, erc_20_read_abi
         )
-        token_balance = amount_in_token_contract.functions.balanceOf(address).call()
+        token_balance = amount_in_token_contract.functions.balanceOf(
+            wallet.address
+        ).call()
         assert token_balance != 0
         assert token_balance >= amount_in
-        allowance_balance = amount_in_token_contract.functions.allowance(
-            address, bend_address
-        ).call()
-        if allowance_balance < amount_in:
-            try:
-                approve_result = self.approve_token(
-                    address,
-                    private_key,
-                    bend_address,
-                    int("0x" + "f" * 64, 16),
-                    weth_address,
-                )
-            except:
-                return "ERR: Something went wrong with allowance. Try again."
-        txn = self.bend_contract.functions.supply(
-            asset=amount_in_token_address,
-            amount=amount_in,
-            onBehalfOf=address,
-            referralCode=0,
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(address),
-            }
+        try:
+            self.ensure_allowance(
+                wallet, amount_in_token_address, bend_address, amount_in
+            )
+        except:
+            return "ERR: Something went wrong with allowance. Try again."
+        txn = self.template.build(
+            "bend_deposit",
+            wallet.address,
+            bend_address,
+            encoder.bend_supply(amount_in_token_address, amount_in, wallet.address),
         )
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
-
-    def bend_borrow(
-        self, address, private_key, amount_out: int, asset_token_address
-    ) -> str:
-        tx_data = self.bend_contract.functions.borrow(
-            asset=asset_token_address,
-            amount=int(amount_out),
-            interestRateMode=2,
-            referralCode=0,
-            onBehalfOf=address,
-        ).buildTransaction(
-            {
-                "gas": 500000 + random.randint(1, 10000),
-                "gasPrice": int(self.w3.eth.gas_price * 1.5),
-                "nonce": self.get_nonce(address),
-            }
+        return self.send_transaction(
+            wallet, txn, "bend_deposit", spends=(amount_in_token_address, bend_address)
         )
-        signed_txn = self.w3.eth.account.sign_transaction(
-            tx_data, private_key=private_key.strip()
+
+    @timed()
+    def bend_borrow(self, wallet, amount_out: int, asset_token_address) -> str:
+        tx_data = self.template.build(
+            "bend_borrow",
+            wallet.address,
+            bend_address,
+            encoder.bend_borrow(
+                asset_token_address, int(amount_out), 2, 0, wallet.address
+            ),
         )
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
+        return self.send_transaction(wallet, tx_data, "bend_borrow")
 
-    def honey_jar_mint(self, address, private_key):
-        allowance_balance = self.honey_contract.functions.allowance(
-            address, ooga_booga_address
-        ).call()
-        if allowance_balance / 1e18 < 4.2:
-            try:
-                approve_result = self.approve_token(
-                    address,
-                    private_key,
-                    ooga_booga_address,
-                    int("0x" + "f" * 64, 16),
-                    honey_address,
-                )
-            except:
-                return "ERR: Something went wrong with allowance. Try again."
-        has_mint = self.ooga_booga_contract.functions.hasMinted(address).call()
+    @timed()
+    def honey_jar_mint(self, wallet):
+        try:
+            self.ensure_allowance(
+                wallet, honey_address, ooga_booga_address, HONEY_JAR_PRICE
+            )
+        except:
+            return "ERR: Something went wrong with allowance. Try again."
+        has_mint = self.ooga_booga_contract.functions.hasMinted(wallet.address).call()
         if has_mint:
             return True
-        signed_txn = self.w3.eth.account.sign_transaction(
-            dict(
-                chainId=80085,
-                nonce=self.get_nonce(address),
-                gasPrice=int(self.w3.eth.gas_price * 1.5),
-                gas= 500000 + random.randint(1, 10000),
-                to=self.w3.toChecksumAddress(ooga_booga_address),
-                data="0xa6f2ae3a",
-            ),
-            private_key.strip(),
+        return self.send_transaction(
+            wallet,
+            self.honey_jar_mint_txn(wallet),
+            "honey_jar_mint",
+            spends=(honey_address, ooga_booga_address),
         )
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
-
-    def deploy_contract(self, address, private_key):
-        solc_version = install_solc('0.4.18')
-        set_solc_version(solc_version)
-        with open('config/WETH.sol', 'r') as f:
-            code = f.read()
-        compiled_sol = compile_source(code)
-        contract_id, contract_interface = compiled_sol.popitem()
-        txn = dict(
-            chainId=80085,
-            gas= 2000000 + random.randint(1, 10000),
-            gasPrice=int(self.w3.eth.gas_price * 1.5),
-            nonce=self.get_nonce(address),
-            data=contract_interface['bin'])
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key=private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
-
-    def create_bera_name(self, address, private_key):
-        fake = Faker('en_US')
-
-        name = fake.name().replace(" ", "").strip()
-        txn = self.bera_name_contract.functions.mintNative(chars=list(name), duration=1,
-                                                           whois=address,
-                                                           metadataURI='https://beranames.com/api/metadata/69',
-                                                           to=address).buildTransaction(
-            {'gas': 2000000, 'gasPrice': int(self.w3.eth.gas_price * 1.15),
-             'nonce': self.get_nonce(address), 'value': int(608614232209737)})
-        signed_txn = self.w3.eth.account.sign_transaction(txn, private_key=private_key.strip())
-        order_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        return order_hash.hex()
+
+    def honey_jar_mint_txn(self, wallet):
+        return self.template.build(
+            "honey_jar_mint", wallet.address, ooga_booga_address, encoder.buy()
+        )
+
+    @timed()
+    def bulk_honey_jar_mint(self, wallets):
+        addresses = [wallet.address for wallet in wallets]
+        snapshot = self.snapshot_accounts(addresses, [honey_address], [ooga_booga_address])
+        minted = self.multicall.call_uint(
+            [
+                (ooga_booga_address, encode_call(HAS_MINTED_SELECTOR, ["address"], [address]))
+                for address in addresses
+            ]
+        )
+        results = {wallet: True for wallet, has_mint in zip(wallets, minted) if has_mint}
+        pending = [wallet for wallet in wallets if wallet not in results]
+        approvals = [
+            wallet
+            for wallet in pending
+            if not self.allowances.is_approved(wallet.address, honey_address, ooga_booga_address)
+            and (snapshot[wallet.address]["allowances"][(honey_address, ooga_booga_address)] or 0)
+            < HONEY_JAR_PRICE
+        ]
+        for wallet, order_hash in zip(
+            approvals, self.bulk_approve(approvals, ooga_booga_address, honey_address)
+        ):
+            if order_hash.startswith("ERR"):
+                results[wallet] = "ERR: Something went wrong with allowance. Try again."
+        pending = [wallet for wallet in pending if wallet not in results]
+        results.update(
+            zip(
+                pending,
+                self.bulk(
+                    pending,
+                    "honey_jar_mint",
+                    self.honey_jar_mint_txn,
+                    spends=(honey_address, ooga_booga_address),
+                ),
+            )
+        )
+        return [results[wallet] for wallet in wallets]
+
+    @timed()
+    def deploy_contract(self, wallet):
+        return self.send_transaction(wallet, self.deploy_contract_txn(wallet), "deploy_contract")
+
+    def deploy_contract_txn(self, wallet):
+        bytecode = weth_bytecode
+        if not bytecode:
+            with self.metrics.timer("solc.compile"):
+                bytecode = self.compiler.compile('config/WETH.sol', '0.4.18')['bin']
+        return self.template.build("deploy_contract", wallet.address, None, bytecode)
+
+    @timed()
+    def bulk_deploy_contract(self, wallets):
+        return self.bulk(wallets, "deploy_contract", self.deploy_contract_txn)
+
+    @timed()
+    def create_bera_name(self, wallet):
+        return self.send_transaction(wallet, self.create_bera_name_txn(wallet), "create_bera_name")
+
+    def create_bera_name_txn(self, wallet):
+        name = self.faker.name().replace(" ", "").strip()
+        return self.template.build(
+            "create_bera_name",
+            wallet.address,
+            bera_name_address,
+            encoder.mint_native(list(name), 1, wallet.address, 'https://beranames.com/api/metadata/69', wallet.address),
+            value=int(608614232209737),
+        )
+
+    @timed()
+    def bulk_create_bera_name(self, wallets):
+        return self.bulk(wallets, "create_bera_name", self.create_bera_name_txn)
@@ -0,0 +1,47 @@
+from loguru import logger
+
+from config.config import rpc_batch_size
+
+
+class Broadcaster:
+    def __init__(self, w3, batch_size=rpc_batch_size):
+        self.w3 = w3
+        self.batch_size = max(batch_size, 1)
+        self.sent = 0
+        self.failed = 0
+
+    def broadcast(self, raw_transactions, accounts=None):
+        if hasattr(self.w3.provider, "make_batch_request"):
+            results = []
+            for start in range(0, len(raw_transactions), self.batch_size):
+                calls = [
+                    ("eth_sendRawTransaction", ["0x" + raw_transaction.hex()])
+                    for raw_transaction in raw_transactions[start:start + self.batch_size]
+                ]
+                if accounts is not None and hasattr(self.w3.provider, "endpoint_for"):
+                    responses = self.w3.provider.make_batch_request(
+                        calls, accounts[start:start + self.batch_size]
+                    )
+                else:
+                    responses = self.w3.provider.make_batch_request(calls)
+                results.extend(
+                    response["result"]
+                    if "result" in response
+                    else ValueError(response.get("error", {}).get("message", response))
+                    for response in responses
+                )
+        else:
+            results = [self._send(raw_transaction) for raw_transaction in raw_transactions]
+        for result in results:
+            if isinstance(result, Exception):
+                self.failed += 1
+                logger.debug(f"Broadcast failed: {str(result)}")
+            else:
+                self.sent += 1
+        return results
+
+    def _send(self, raw_transaction):
+        try:
+            return self.w3.eth.send_raw_transaction(raw_transaction).hex()
+        except Exception as e:
+            return e
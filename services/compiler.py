@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+import threading
+
+from loguru import logger
+
+from config.config import cache_dir
+
+
+class ContractCompiler:
+    def __init__(self, directory=None):
+        self.directory = os.path.join(directory or cache_dir, "solc")
+        self._artifacts = {}
+        self._sources = {}
+        self._lock = threading.Lock()
+
+    def _cache_key(self, source_path, version):
+        if (source_path, version) not in self._sources:
+            with open(source_path, "r", encoding="utf-8") as f:
+                source = f.read()
+            digest = hashlib.sha256(f"{version}\n{source}".encode()).hexdigest()
+            self._sources[(source_path, version)] = (digest, source)
+        return self._sources[(source_path, version)]
+
+    def compile(self, source_path, version):
+        with self._lock:
+            key, source = self._cache_key(source_path, version)
+            artifact = self._artifacts.get(key)
+            if artifact is None:
+                artifact = self._load(key) or self._compile(key, source, version)
+                self._artifacts[key] = artifact
+            return artifact
+
+    def _load(self, key):
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            logger.warning(f"Broken compile artifact {path}, recompiling")
+            return None
+
+    def _compile(self, key, source, version):
+        from solcx import compile_source, get_installed_solc_versions, install_solc
+
+        logger.info(f"Compiling contract with solc {version}...")
+        if version not in map(str, get_installed_solc_versions()):
+            install_solc(version)
+        compiled_sol = compile_source(
+            source, output_values=["abi", "bin"], solc_version=version
+        )
+        contract_id, contract_interface = compiled_sol.popitem()
+        artifact = {
+            "contract": contract_id,
+            "abi": contract_interface["abi"],
+            "bin": contract_interface["bin"],
+        }
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(artifact, f)
+        return artifact
@@ -0,0 +1,38 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from eth_utils import to_checksum_address
+
+from config.config import contract_cache_size, checksum_cache_size
+
+
+@lru_cache(maxsize=checksum_cache_size)
+def checksum(address):
+    return to_checksum_address(address)
+
+
+class ContractRegistry:
+    def __init__(self, w3, maxsize=contract_cache_size):
+        self.w3 = w3
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._contracts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, address, abi):
+        key = (address.lower(), id(abi))
+        with self._lock:
+            contract = self._contracts.get(key)
+            if contract is not None:
+                self._contracts.move_to_end(key)
+                self.hits += 1
+                return contract
+            self.misses += 1
+        contract = self.w3.eth.contract(address=checksum(address), abi=abi)
+        with self._lock:
+            self._contracts[key] = contract
+            while len(self._contracts) > self.maxsize:
+                self._contracts.popitem(last=False)
+        return contract
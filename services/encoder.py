@@ -0,0 +1,95 @@
+from eth_abi import encode_single
+from eth_utils import function_signature_to_4byte_selector
+
+
+def function(signature):
+    return (
+        function_signature_to_4byte_selector(signature),
+        signature[signature.index("("):],
+    )
+
+
+APPROVE = function("approve(address,uint256)")
+BATCH_SWAP = function(
+    "batchSwap(uint8,(address,address,uint256,address,uint256,bytes)[],uint256)"
+)
+ADD_LIQUIDITY = function("addLiquidity(address,address,address[],uint256[])")
+HONEY_MINT = function("mint(address,address,uint256)")
+HONEY_REDEEM = function("redeem(address,uint256,address)")
+BEND_SUPPLY = function("supply(address,uint256,address,uint16)")
+BEND_BORROW = function("borrow(address,uint256,uint256,uint16,address)")
+MINT_NATIVE = function("mintNative(string[],uint256,address,string,address)")
+BUY_SELECTOR = bytes.fromhex("a6f2ae3a")
+
+
+def encode(function, *args):
+    selector, types = function
+    return "0x" + (selector + encode_single(types, args)).hex()
+
+
+def approve(spender, amount):
+    return encode(APPROVE, spender, amount)
+
+
+def batch_swap(swaps, deadline, kind=0):
+    return encode(
+        BATCH_SWAP,
+        kind,
+        [
+            (
+                swap["poolId"],
+                swap["assetIn"],
+                swap["amountIn"],
+                swap["assetOut"],
+                swap["amountOut"],
+                swap["userData"],
+            )
+            for swap in swaps
+        ],
+        deadline,
+    )
+
+
+def add_liquidity(pool, receiver, assets_in, amounts_in):
+    return encode(ADD_LIQUIDITY, pool, receiver, assets_in, amounts_in)
+
+
+def honey_mint(to, collateral, amount):
+    return encode(HONEY_MINT, to, collateral, amount)
+
+
+def honey_redeem(to, amount, collateral):
+    return encode(HONEY_REDEEM, to, amount, collateral)
+
+
+def bend_supply(asset, amount, on_behalf_of, referral_code=0):
+    return encode(BEND_SUPPLY, asset, amount, on_behalf_of, referral_code)
+
+
+def bend_borrow(asset, amount, interest_rate_mode, referral_code, on_behalf_of):
+    return encode(
+        BEND_BORROW, asset, amount, interest_rate_mode, referral_code, on_behalf_of
+    )
+
+
+def mint_native(chars, duration, whois, metadata_uri, to):
+    return encode(MINT_NATIVE, chars, duration, whois, metadata_uri, to)
+
+
+def buy():
+    return "0x" + BUY_SELECTOR.hex()
+
+
+def transaction(to, data, chain_id, nonce, gas, fees, value=0):
+    txn = {
+        "chainId": chain_id,
+        "nonce": nonce,
+        "gas": gas,
+        "to": to,
+        "value": value,
+        "data": data,
+        **fees,
+    }
+    if to is None:
+        del txn["to"]
+    return txn
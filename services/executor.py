@@ -0,0 +1,43 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from loguru import logger
+
+from config.config import max_workers
+
+
+class WalletExecutor:
+    def __init__(self, concurrency=max_workers):
+        self.concurrency = concurrency
+
+    def _run_wallet(self, route, args):
+        try:
+            return route(*args)
+        except Exception as e:
+            logger.error(f"Route {getattr(route, '__name__', route)} failed: {str(e)}")
+            return e
+
+    def run(self, route, *iterables):
+        jobs = list(zip(*iterables))
+        if self.concurrency <= 1:
+            return [self._run_wallet(route, args) for args in jobs]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            return list(pool.map(lambda args: self._run_wallet(route, args), jobs))
+
+
+class AsyncWalletExecutor:
+    def __init__(self, concurrency=max_workers):
+        self.concurrency = concurrency
+
+    async def run(self, route, *iterables):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def run_wallet(args):
+            async with semaphore:
+                try:
+                    return await route(*args)
+                except Exception as e:
+                    logger.error(f"Route {getattr(route, '__name__', route)} failed: {str(e)}")
+                    return e
+
+        return await asyncio.gather(*(run_wallet(args) for args in zip(*iterables)))
@@ -0,0 +1,130 @@
+import threading
+import time
+
+from loguru import logger
+
+from config.config import (
+    gas_price_ttl,
+    gas_price_multipliers,
+    fee_mode,
+    fee_strategies,
+    fee_strategy_percentiles,
+    fee_history_blocks,
+    base_fee_multiplier,
+)
+
+
+UNSUPPORTED_ERRORS = ("-32601", "not supported", "method not found")
+
+
+def is_unsupported(error):
+    message = str(error).lower()
+    return any(text in message for text in UNSUPPORTED_ERRORS)
+
+
+def summarize_fee_history(history, percentiles):
+    rewards = [row for row in history["reward"] or [] if row]
+    return {
+        "base_fee": history["baseFeePerGas"][-1],
+        "priority_fees": {
+            percentile: sorted(row[index] for row in rewards)[len(rewards) // 2]
+            if rewards
+            else 0
+            for index, percentile in enumerate(percentiles)
+        },
+    }
+
+
+class GasPriceOracle:
+    def __init__(self, w3, ttl=gas_price_ttl, multipliers=None, mode=fee_mode, strategies=None):
+        self.w3 = w3
+        self.ttl = ttl
+        self.multipliers = multipliers or gas_price_multipliers
+        self.mode = mode
+        self.strategies = strategies or fee_strategies
+        self.percentiles = sorted(fee_strategy_percentiles.values())
+        self.hits = 0
+        self.misses = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def missing(self, results):
+        if self.mode == "eip1559" and results.get("fee_history", True) is not None:
+            name = "fee_history"
+        else:
+            name = "gas_price"
+        if name in results:
+            return None
+        value, updated_at = self._cache.get(name, (None, 0))
+        if value is None or time.monotonic() - updated_at >= self.ttl:
+            self.misses += 1
+            return name
+        self.hits += 1
+        results[name] = value
+        return None
+
+    def receive(self, results, name, result=None, error=None):
+        if error is not None:
+            if name != "fee_history":
+                raise error
+            self.fee_history_failed(error)
+            results[name] = None
+            return
+        if name == "fee_history":
+            result = summarize_fee_history(result, self.percentiles)
+        self._cache[name] = (result, time.monotonic())
+        results[name] = result
+
+    def fetch(self, name):
+        if name == "fee_history":
+            return self.w3.eth.fee_history(fee_history_blocks, "latest", self.percentiles)
+        return self.w3.eth.gas_price
+
+    def resolve(self, results):
+        with self._lock:
+            name = self.missing(results)
+            while name is not None:
+                try:
+                    result = self.fetch(name)
+                except Exception as e:
+                    self.receive(results, name, error=e)
+                else:
+                    self.receive(results, name, result)
+                name = self.missing(results)
+            return results
+
+    def fee_history_failed(self, error):
+        if is_unsupported(error):
+            logger.warning(f"eth_feeHistory is not supported, switching to legacy gas price: {str(error)}")
+            self.mode = "legacy"
+        else:
+            logger.warning(f"eth_feeHistory failed, using legacy gas price once: {str(error)}")
+
+    def legacy_fees(self, gas_price, action="default"):
+        multiplier = self.multipliers.get(action, self.multipliers["default"])
+        return {"gasPrice": int(gas_price * multiplier)}
+
+    def eip1559_fees(self, history, action="default"):
+        strategy = self.strategies.get(action, self.strategies["default"])
+        priority_fee = history["priority_fees"][fee_strategy_percentiles[strategy]]
+        return {
+            "type": 2,
+            "maxPriorityFeePerGas": priority_fee,
+            "maxFeePerGas": int(history["base_fee"] * base_fee_multiplier) + priority_fee,
+        }
+
+    def fees_from(self, results, action="default"):
+        if results.get("fee_history") is not None:
+            return self.eip1559_fees(results["fee_history"], action)
+        return self.legacy_fees(results["gas_price"], action)
+
+    def fees(self, action="default"):
+        return self.fees_from(self.resolve({}), action)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0,
+        }
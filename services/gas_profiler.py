@@ -0,0 +1,115 @@
+import atexit
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+
+from loguru import logger
+
+from config.config import (
+    cache_dir,
+    gas_profile_window,
+    gas_profile_percentile,
+    gas_profile_headroom,
+    gas_profile_min_samples,
+    gas_profile_save_interval,
+)
+
+
+class GasProfiler:
+    def __init__(
+        self,
+        path=None,
+        window=gas_profile_window,
+        percentile=gas_profile_percentile,
+        headroom=gas_profile_headroom,
+        min_samples=gas_profile_min_samples,
+    ):
+        self.path = path or os.path.join(cache_dir, "gas_profile.json")
+        self.window = window
+        self.percentile = percentile
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self._samples = {}
+        self._dirty = False
+        self._saved_at = 0
+        self._lock = threading.Lock()
+        self._load()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def key(action, pool=None):
+        return f"{action}:{pool}".lower() if pool else action
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self._samples = {
+                key: deque(samples, maxlen=self.window) for key, samples in data.items()
+            }
+        except FileNotFoundError:
+            pass
+        except (ValueError, AttributeError):
+            logger.warning(f"Broken gas profile {self.path}, starting empty")
+
+    def _save(self):
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({key: list(samples) for key, samples in self._samples.items()}, f)
+        os.replace(temp_path, self.path)
+
+    def flush(self):
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def record(self, action, pool, gas_used):
+        key = self.key(action, pool)
+        with self._lock:
+            self._samples.setdefault(key, deque(maxlen=self.window)).append(int(gas_used))
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= gas_profile_save_interval:
+                self._save()
+
+    def forget(self, action, pool=None):
+        with self._lock:
+            if self._samples.pop(self.key(action, pool), None) is not None:
+                self._dirty = True
+
+    def _percentile(self, samples, percentile):
+        ordered = sorted(samples)
+        return ordered[max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)]
+
+    def limit(self, action, pool=None):
+        with self._lock:
+            samples = self._samples.get(self.key(action, pool))
+            if not samples or len(samples) < self.min_samples:
+                return None
+            return int(self._percentile(samples, self.percentile) * self.headroom)
+
+    def export(self, path=None):
+        with self._lock:
+            table = {
+                key: {
+                    "samples": len(samples),
+                    "min": min(samples),
+                    "p50": self._percentile(samples, 50),
+                    f"p{self.percentile}": self._percentile(samples, self.percentile),
+                    "max": max(samples),
+                    "limit": int(self._percentile(samples, self.percentile) * self.headroom)
+                    if len(samples) >= self.min_samples
+                    else None,
+                }
+                for key, samples in sorted(self._samples.items())
+                if samples
+            }
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(table, f, indent=2)
+        return table
@@ -0,0 +1,233 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+from loguru import logger
+
+from config.config import metrics_path, metrics_window
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+_exporters = {}
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def export_all():
+    for metrics in list(_exporters.values()):
+        metrics.export()
+
+
+def gauge_samples(metric, value, labels, bound=()):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if labels and labels[0]:
+                yield from gauge_samples(metric, item, labels[1:], bound + ((labels[0], key),))
+            else:
+                yield from gauge_samples(f"{metric}_{key}", item, labels[1:], bound)
+    elif isinstance(value, (bool, int, float)):
+        yield metric, bound, float(value)
+
+
+def payload_size(payload):
+    try:
+        return len(json.dumps(payload, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return 0
+
+
+class Metrics:
+    def __init__(self, path=metrics_path, window=metrics_window):
+        self.path = path
+        self.window = window
+        self._series = {}
+        self._gauges = {}
+        self._started_at = time.time()
+        self._lock = threading.Lock()
+        if self.path:
+            if not _exporters:
+                atexit.register(export_all)
+            _exporters[self.path] = self
+
+    def observe(self, name, seconds, error=False, bytes_sent=0, bytes_received=0):
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = {
+                    "count": 0,
+                    "errors": 0,
+                    "seconds": 0.0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "samples": deque(maxlen=self.window),
+                }
+            series["count"] += 1
+            series["errors"] += bool(error)
+            series["seconds"] += seconds
+            series["bytes_sent"] += bytes_sent
+            series["bytes_received"] += bytes_received
+            series["samples"].append(seconds)
+
+    def gauge(self, name, collect, labels=()):
+        self._gauges[name] = (collect, tuple(labels))
+
+    def gauges(self):
+        return {name: collect() for name, (collect, _) in sorted(self._gauges.items())}
+
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.observe(name, time.perf_counter() - started, error=True)
+            raise
+        self.observe(name, time.perf_counter() - started)
+
+    def middleware(self, make_request, w3):
+        def middleware(method, params):
+            started = time.perf_counter()
+            try:
+                response = make_request(method, params)
+            except Exception:
+                self.observe(
+                    f"rpc.{method}",
+                    time.perf_counter() - started,
+                    error=True,
+                    bytes_sent=payload_size(params),
+                )
+                raise
+            self.observe(
+                f"rpc.{method}",
+                time.perf_counter() - started,
+                error="error" in response,
+                bytes_sent=payload_size(params),
+                bytes_received=payload_size(response),
+            )
+            return response
+
+        return middleware
+
+    def observe_batch(self, calls, responses, seconds):
+        for (method, params), response in zip(calls, responses):
+            self.observe(
+                f"rpc.{method}",
+                seconds,
+                error="error" in response,
+                bytes_sent=payload_size(params),
+                bytes_received=payload_size(response),
+            )
+
+    def summary(self):
+        with self._lock:
+            series = {
+                name: dict(values, samples=list(values["samples"]))
+                for name, values in self._series.items()
+            }
+        return {
+            name: {
+                "count": values["count"],
+                "errors": values["errors"],
+                "seconds": round(values["seconds"], 6),
+                "bytes_sent": values["bytes_sent"],
+                "bytes_received": values["bytes_received"],
+                **{
+                    f"p{int(quantile * 100)}": round(percentile(values["samples"], quantile), 6)
+                    for quantile in QUANTILES
+                },
+            }
+            for name, values in sorted(series.items())
+        }
+
+    def prometheus(self):
+        summary = self.summary()
+        lines = []
+        for metric, kind, help_text in (
+            ("berachain_duration_seconds", "summary", "Time spent per RPC method or action"),
+            ("berachain_errors_total", "counter", "Failed calls per RPC method or action"),
+            ("berachain_bytes_sent_total", "counter", "JSON payload bytes sent per RPC method"),
+            ("berachain_bytes_received_total", "counter", "JSON payload bytes received per RPC method"),
+        ):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, values in summary.items():
+                label = f'name="{name}"'
+                if kind == "summary":
+                    for quantile in QUANTILES:
+                        lines.append(
+                            f'{metric}{{{label},quantile="{quantile}"}} '
+                            f'{values[f"p{int(quantile * 100)}"]}'
+                        )
+                    lines.append(f"{metric}_sum{{{label}}} {values['seconds']}")
+                    lines.append(f"{metric}_count{{{label}}} {values['count']}")
+                else:
+                    field = metric[len("berachain_"):-len("_total")]
+                    lines.append(f"{metric}{{{label}}} {values[field]}")
+        samples = {}
+        for name, (collect, labels) in sorted(self._gauges.items()):
+            for metric, bound, value in gauge_samples(f"berachain_{name}", collect(), labels):
+                samples.setdefault(metric, []).append((bound, value))
+        for metric, values in samples.items():
+            lines.append(f"# TYPE {metric} gauge")
+            for bound, value in values:
+                label = ",".join(f'{key}="{item}"' for key, item in bound)
+                lines.append(f"{metric}{{{label}}} {value}" if label else f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path=None):
+        path = path or self.path
+        if not path or not self._series:
+            return None
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if path.endswith(".prom"):
+            content = self.prometheus()
+        else:
+            content = json.dumps(
+                {
+                    "started_at": self._started_at,
+                    "duration": round(time.time() - self._started_at, 3),
+                    "metrics": self.summary(),
+                    "gauges": self.gauges(),
+                },
+                indent=2,
+            )
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        logger.info(f"Metrics saved to {path}")
+        return path
+
+
+def timed(name=None):
+    def decorate(method):
+        metric = f"bera.{name or method.__name__}"
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception:
+                self.metrics.observe(metric, time.perf_counter() - started, error=True)
+                raise
+            self.metrics.observe(
+                metric,
+                time.perf_counter() - started,
+                error=isinstance(result, str) and result.startswith("ERR"),
+            )
+            return result
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,67 @@
+from eth_abi import decode_single, encode_single
+from eth_utils import function_signature_to_4byte_selector
+
+from config.abi import multicall3_abi
+from config.config import multicall_chunk_size
+from config.contracts_addresses import multicall3_address
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector("balanceOf(address)")
+ALLOWANCE_SELECTOR = function_signature_to_4byte_selector("allowance(address,address)")
+GET_ETH_BALANCE_SELECTOR = function_signature_to_4byte_selector("getEthBalance(address)")
+
+
+def encode_call(selector, types, args):
+    return selector + encode_single(f"({','.join(types)})", args)
+
+
+class Multicall:
+    def __init__(self, w3, chunk_size=multicall_chunk_size):
+        self.w3 = w3
+        self.chunk_size = chunk_size
+        self.contract = w3.eth.contract(address=multicall3_address, abi=multicall3_abi)
+
+    def aggregate(self, calls, block_identifier="latest"):
+        results = []
+        for start in range(0, len(calls), self.chunk_size):
+            chunk = [
+                (target, True, call_data)
+                for target, call_data in calls[start:start + self.chunk_size]
+            ]
+            results.extend(
+                self.contract.functions.aggregate3(chunk).call(
+                    block_identifier=block_identifier
+                )
+            )
+        return results
+
+    def call_uint(self, calls, block_identifier="latest"):
+        return [
+            decode_single("uint256", return_data) if success and return_data else None
+            for success, return_data in self.aggregate(calls, block_identifier)
+        ]
+
+    def snapshot_accounts(self, addresses, tokens=(), spenders=()):
+        calls = []
+        for address in addresses:
+            calls.append(
+                (multicall3_address, encode_call(GET_ETH_BALANCE_SELECTOR, ["address"], [address]))
+            )
+            for token in tokens:
+                calls.append((token, encode_call(BALANCE_OF_SELECTOR, ["address"], [address])))
+                for spender in spenders:
+                    calls.append(
+                        (token, encode_call(ALLOWANCE_SELECTOR, ["address", "address"], [address, spender]))
+                    )
+        values = iter(self.call_uint(calls))
+        snapshot = {}
+        for address in addresses:
+            account = snapshot[address] = {
+                "native": next(values),
+                "balances": {},
+                "allowances": {},
+            }
+            for token in tokens:
+                account["balances"][token] = next(values)
+                for spender in spenders:
+                    account["allowances"][(token, spender)] = next(values)
+        return snapshot
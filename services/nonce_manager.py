@@ -0,0 +1,66 @@
+import threading
+
+from loguru import logger
+
+from config.config import rpc_batch_size
+
+NONCE_ERRORS = ("nonce too low", "replacement transaction underpriced")
+
+
+class NonceManager:
+    def __init__(self, w3, batch_size=rpc_batch_size):
+        self.w3 = w3
+        self.batch_size = max(batch_size, 1)
+        self._nonces = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def _account_lock(self, address):
+        with self._lock:
+            return self._locks.setdefault(address.lower(), threading.Lock())
+
+    def get_nonce(self, address):
+        key = address.lower()
+        with self._account_lock(address):
+            nonce = self._nonces.get(key)
+            if nonce is None:
+                nonce = self.w3.eth.get_transaction_count(address, "pending")
+            self._nonces[key] = nonce + 1
+            return nonce
+
+    def take(self, address):
+        key = address.lower()
+        with self._account_lock(address):
+            nonce = self._nonces.get(key)
+            if nonce is not None:
+                self._nonces[key] = nonce + 1
+            return nonce
+
+    def seed(self, address, nonce):
+        with self._account_lock(address):
+            self._nonces.setdefault(address.lower(), nonce)
+
+    def prefetch(self, addresses):
+        with self._lock:
+            missing = [address for address in addresses if address.lower() not in self._nonces]
+        if not missing or not hasattr(self.w3.provider, "make_batch_request"):
+            return
+        for start in range(0, len(missing), self.batch_size):
+            chunk = missing[start:start + self.batch_size]
+            responses = self.w3.provider.make_batch_request(
+                [("eth_getTransactionCount", [address, "pending"]) for address in chunk]
+            )
+            for address, response in zip(chunk, responses):
+                if "result" not in response:
+                    continue
+                self.seed(address, int(response["result"], 16))
+
+    def resync(self, address):
+        with self._account_lock(address):
+            if self._nonces.pop(address.lower(), None) is not None:
+                logger.debug(f"Nonce for {address} will be refetched")
+
+    @staticmethod
+    def is_nonce_error(error):
+        message = str(error).lower()
+        return any(text in message for text in NONCE_ERRORS)
@@ -0,0 +1,81 @@
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+from loguru import logger
+
+
+class Action:
+    def __init__(self, name, submit, depends_on=()):
+        self.name = name
+        self.submit = submit
+        self.depends_on = tuple(depends_on)
+
+
+class ActionPipeline:
+    def __init__(self, receipts, label=""):
+        self.receipts = receipts
+        self.label = label
+        self.actions = {}
+
+    def add(self, name, submit, depends_on=()):
+        if name in self.actions:
+            raise ValueError(f"Action {name} is already in the pipeline")
+        for dependency in depends_on:
+            if dependency not in self.actions:
+                raise ValueError(f"Unknown dependency {dependency} for action {name}")
+        self.actions[name] = Action(name, submit, depends_on)
+        return self
+
+    def run(self):
+        status = {}
+        pending = {}
+        waiting = list(self.actions.values())
+        while waiting or pending:
+            ready = []
+            for action in list(waiting):
+                dependencies = [status.get(name) for name in action.depends_on]
+                if False in dependencies:
+                    waiting.remove(action)
+                    status[action.name] = False
+                    logger.warning(f"{self.label} {action.name} skipped: dependency failed")
+                elif None not in dependencies:
+                    waiting.remove(action)
+                    ready.append(action)
+            for action in ready:
+                result = self._submit(action)
+                if isinstance(result, Future):
+                    pending[result] = action.name
+                else:
+                    status[action.name] = result
+            if not ready and pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    status[name] = self._confirmed(name, future)
+        return status
+
+    def _submit(self, action):
+        try:
+            result = action.submit()
+        except Exception as e:
+            logger.error(f"{self.label} {action.name} failed: {str(e)}")
+            return False
+        if isinstance(result, str) and result.startswith("0x"):
+            logger.info(f"{self.label} {action.name} sent. TxID: {result}")
+            return self.receipts.track(result)
+        if result is True:
+            logger.info(f"{self.label} {action.name} has nothing to do")
+            return True
+        logger.error(f"{self.label} {action.name} failed: {result}")
+        return False
+
+    def _confirmed(self, name, future):
+        try:
+            receipt = future.result()
+        except Exception as e:
+            logger.error(f"{self.label} {name} is not confirmed: {str(e)}")
+            return False
+        if receipt["status"] != 1:
+            logger.error(f"{self.label} {name} reverted. TxID: {receipt['transactionHash']}")
+            return False
+        logger.success(f"{self.label} {name} success. TxID: {receipt['transactionHash']}")
+        return True
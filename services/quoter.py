@@ -0,0 +1,165 @@
+import threading
+import time
+
+from loguru import logger
+
+from config.config import quote_block_ttl, route_cache_ttl
+from config.contracts_addresses import (
+    usdc_address,
+    weth_address,
+    wbear_address,
+    usdc_pool_address,
+    weth_pool_address,
+)
+from services.contracts import checksum
+
+
+def router_request(base_asset, quote_asset, amount, fake):
+    return {
+        "url": "https://artio-80085-dex-router.berachain.com/dex/route",
+        "params": {
+            "quoteAsset": quote_asset,
+            "baseAsset": base_asset,
+            "amount": str(amount),
+            "swap_type": "given_in",
+        },
+        "headers": {
+            "authority": "artio-80085-dex-router.berachain.com",
+            "accept": "*/*",
+            "accept-language": "zh-CN,zh;q=0.9",
+            "cache-control": "no-cache",
+            "origin": "https://artio.bex.berachain.com",
+            "pragma": "no-cache",
+            "referer": "https://artio.bex.berachain.com/",
+            "user-agent": fake.chrome(),
+        },
+    }
+
+
+class SwapQuoter:
+    def __init__(
+        self,
+        w3,
+        bex_contract,
+        block_ttl=quote_block_ttl,
+        route_ttl=route_cache_ttl,
+        metrics=None,
+    ):
+        self.w3 = w3
+        self.bex_contract = bex_contract
+        self.block_ttl = block_ttl
+        self.route_ttl = route_ttl
+        self.metrics = metrics
+        self.pools = {
+            (wbear_address.lower(), usdc_address.lower()): usdc_pool_address,
+            (wbear_address.lower(), weth_address.lower()): weth_pool_address,
+        }
+        self.router_requests = 0
+        self.route_hits = 0
+        self._block = None
+        self._block_updated_at = 0
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def pool_for(self, base_asset, quote_asset):
+        return self.pools.get((base_asset.lower(), quote_asset.lower()))
+
+    def block_number(self):
+        with self._lock:
+            if self._block is not None and time.monotonic() - self._block_updated_at < self.block_ttl:
+                return self._block
+        block = self.w3.eth.block_number
+        with self._lock:
+            self._block = block
+            self._block_updated_at = time.monotonic()
+        return block
+
+    def quote(self, base_asset, quote_asset, amount, fake=None, session=None):
+        pool = self.pool_for(base_asset, quote_asset)
+        if pool is not None:
+            try:
+                return self.preview(pool, base_asset, quote_asset, amount)
+            except Exception as e:
+                logger.warning(f"On-chain quote failed, using dex router: {str(e)}")
+        return self.route(base_asset, quote_asset, amount, fake, session)
+
+    def preview(self, pool, base_asset, quote_asset, amount):
+        asset, amount_out = self.bex_contract.functions.getPreviewSwapExact(
+            0, pool, base_asset, int(amount), quote_asset
+        ).call(block_identifier=self.block_number())
+        if asset.lower() != quote_asset.lower() or amount_out == 0:
+            raise ValueError("getPreviewSwapExact does not match the requested pair")
+        return [
+            {
+                "pool": pool,
+                "assetIn": base_asset,
+                "amountIn": str(int(amount)),
+                "assetOut": quote_asset,
+                "amountOut": str(amount_out),
+            }
+        ]
+
+    def route(self, base_asset, quote_asset, amount, fake, session):
+        key = (base_asset.lower(), quote_asset.lower(), int(amount).bit_length())
+        with self._lock:
+            cached = self._routes.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.route_ttl:
+            try:
+                steps = self.verify_route(self.rescale_route(cached[1], amount))
+                with self._lock:
+                    self.route_hits += 1
+                return steps
+            except Exception as e:
+                logger.warning(f"Cached route is stale, using dex router: {str(e)}")
+        steps = self.route_via_router(base_asset, quote_asset, amount, fake, session)
+        with self._lock:
+            self._routes[key] = (time.monotonic(), steps)
+        return steps
+
+    @staticmethod
+    def rescale_route(steps, amount):
+        cached_amount = int(steps[0]["amountIn"])
+        if cached_amount == 0:
+            raise ValueError("Cached route has zero amountIn")
+        return [
+            dict(
+                step,
+                amountIn=str(int(step["amountIn"]) * int(amount) // cached_amount),
+                amountOut=str(int(step["amountOut"]) * int(amount) // cached_amount),
+            )
+            for step in steps
+        ]
+
+    def verify_route(self, steps):
+        swaps = [
+            (
+                checksum(step["pool"]),
+                checksum(step["assetIn"]),
+                int(step["amountIn"]),
+                checksum(step["assetOut"]),
+                int(step["amountOut"]),
+                b"",
+            )
+            for step in steps
+        ]
+        asset, amount_out = self.bex_contract.functions.getPreviewBatchSwap(
+            0, swaps
+        ).call(block_identifier=self.block_number())
+        if asset.lower() != steps[-1]["assetOut"].lower() or amount_out == 0:
+            raise ValueError("getPreviewBatchSwap does not match the cached route")
+        steps[-1]["amountOut"] = str(amount_out)
+        return steps
+
+    def route_via_router(self, base_asset, quote_asset, amount, fake, session):
+        self.router_requests += 1
+        started = time.perf_counter()
+        response = session.get(**router_request(base_asset, quote_asset, amount, fake))
+        if self.metrics is not None:
+            self.metrics.observe(
+                "http.dex_router",
+                time.perf_counter() - started,
+                error=response.status_code != 200,
+                bytes_received=len(response.content),
+            )
+        assert response.status_code == 200
+        return response.json()["steps"]
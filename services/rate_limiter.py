@@ -0,0 +1,182 @@
+import threading
+import time
+
+from loguru import logger
+from web3.providers import BaseProvider
+
+from config.config import (
+    rpc_rate_limits,
+    rpc_rate_min,
+    rpc_rate_max,
+    rpc_rate_increase,
+    rpc_rate_decrease,
+    rpc_rate_latency_factor,
+)
+
+SEND_METHODS = {"eth_sendRawTransaction", "eth_sendTransaction"}
+RATE_LIMIT_ERRORS = ("too many requests", "rate limit", "request rate", "request count")
+LATENCY_SMOOTHING = 0.05
+BASELINE_DRIFT = 0.01
+LATENCY_MIN_SAMPLES = 20
+
+
+def is_rate_limited(error):
+    message = str(error).lower()
+    return any(text in message for text in RATE_LIMIT_ERRORS)
+
+
+def method_class(method):
+    return "send" if method in SEND_METHODS else "read"
+
+
+class AdaptiveRateLimiter:
+    def __init__(
+        self,
+        rate,
+        min_rate=rpc_rate_min,
+        max_rate=rpc_rate_max,
+        increase=rpc_rate_increase,
+        decrease=rpc_rate_decrease,
+        latency_factor=rpc_rate_latency_factor,
+    ):
+        self.rate = float(rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+        self.latency = None
+        self.baseline = None
+        self.samples = 0
+        self._tokens = self.rate
+        self._updated_at = time.monotonic()
+        self._started_at = self._updated_at
+        self._decreased_at = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            self.requests += tokens
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+            self.waited += delay
+        if delay:
+            time.sleep(delay)
+        return now + delay
+
+    def succeeded(self, latency=None, tokens=1):
+        with self._lock:
+            congested = False
+            if latency is not None:
+                self.samples += 1
+                self.latency = (
+                    latency
+                    if self.latency is None
+                    else self.latency + (latency - self.latency) * LATENCY_SMOOTHING
+                )
+                if self.baseline is None or self.latency < self.baseline:
+                    self.baseline = self.latency
+                else:
+                    self.baseline += (self.latency - self.baseline) * BASELINE_DRIFT
+                congested = (
+                    self.samples >= LATENCY_MIN_SAMPLES
+                    and self.latency > self.baseline * self.latency_factor
+                )
+            if congested:
+                self._decrease("latency")
+            elif self._tokens < self.rate / 2:
+                self.rate = min(self.max_rate, self.rate + self.increase * tokens / self.rate)
+
+    def rate_limited(self, admitted_at=None):
+        with self._lock:
+            self.throttled += 1
+            if admitted_at is None or admitted_at >= self._decreased_at:
+                self._decrease("429")
+
+    def _decrease(self, reason):
+        now = time.monotonic()
+        if now - self._decreased_at < max(1 / self.rate, self.latency or 0):
+            return
+        self._decreased_at = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        self._tokens = min(self._tokens, 0)
+        logger.debug(f"Rate limit lowered to {self.rate:.1f} req/s ({reason})")
+
+    def stats(self):
+        elapsed = time.monotonic() - self._started_at
+        return {
+            "rate": round(self.rate, 1),
+            "requests": self.requests,
+            "throughput": round(self.requests / elapsed, 1) if elapsed else 0,
+            "throttled": self.throttled,
+            "waited": round(self.waited, 2),
+        }
+
+
+class RateLimitedProvider(BaseProvider):
+    def __init__(self, provider, rates=None):
+        self.provider = provider
+        rates = rates or rpc_rate_limits
+        self.limiters = {
+            name: AdaptiveRateLimiter(rates.get(name, rates["read"]))
+            for name in ("read", "send")
+        }
+
+    @property
+    def endpoint_uri(self):
+        return getattr(self.provider, "endpoint_uri", None)
+
+    def make_request(self, method, params):
+        limiter = self.limiters[method_class(method)]
+        admitted_at = limiter.acquire()
+        started = time.monotonic()
+        try:
+            response = self.provider.make_request(method, params)
+        except Exception as e:
+            if is_rate_limited(e):
+                limiter.rate_limited(admitted_at)
+            raise
+        if "error" in response and is_rate_limited(response["error"]):
+            limiter.rate_limited(admitted_at)
+        else:
+            limiter.succeeded(time.monotonic() - started)
+        return response
+
+    def make_batch_request(self, calls):
+        counts = {}
+        for method, _ in calls:
+            name = method_class(method)
+            counts[name] = counts.get(name, 0) + 1
+        admitted_at = {
+            name: self.limiters[name].acquire(count) for name, count in counts.items()
+        }
+        try:
+            responses = self.provider.make_batch_request(calls)
+        except Exception as e:
+            if is_rate_limited(e):
+                for name in counts:
+                    self.limiters[name].rate_limited(admitted_at[name])
+            raise
+        throttled = {
+            method_class(method)
+            for (method, _), response in zip(calls, responses)
+            if "error" in response and is_rate_limited(response["error"])
+        }
+        for name, count in counts.items():
+            if name in throttled:
+                self.limiters[name].rate_limited(admitted_at[name])
+            else:
+                self.limiters[name].succeeded(tokens=count)
+        return responses
+
+    def isConnected(self):
+        return self.provider.isConnected()
+
+    def stats(self):
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
@@ -0,0 +1,104 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from loguru import logger
+from web3.exceptions import TransactionNotFound
+
+from config.config import receipt_poll_interval, receipt_timeout, rpc_batch_size
+
+
+def to_int(value):
+    if isinstance(value, str):
+        return int(value, 16)
+    return value
+
+
+class ReceiptTracker:
+    def __init__(self, w3, poll_interval=receipt_poll_interval, batch_size=rpc_batch_size):
+        self.w3 = w3
+        self.poll_interval = poll_interval
+        self.batch_size = max(batch_size, 1)
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def track(self, tx_hash, timeout=receipt_timeout):
+        tx_hash = tx_hash if isinstance(tx_hash, str) else tx_hash.hex()
+        tx_hash = tx_hash.lower()
+        with self._lock:
+            if tx_hash not in self._pending:
+                self._pending[tx_hash] = (Future(), time.monotonic() + timeout)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+                self._thread.start()
+            return self._pending[tx_hash][0]
+
+    def wait(self, tx_hash, timeout=receipt_timeout):
+        return self.track(tx_hash, timeout).result()
+
+    def wait_all(self, tx_hashes, timeout=receipt_timeout):
+        futures = [self.track(tx_hash, timeout) for tx_hash in tx_hashes]
+        receipts = []
+        for future in futures:
+            try:
+                receipts.append(future.result())
+            except Exception as e:
+                receipts.append(e)
+        return receipts
+
+    def _poll_loop(self):
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                hashes = list(self._pending)
+                if not hashes:
+                    self._thread = None
+                    return
+            try:
+                receipts = self._fetch(hashes)
+            except Exception as e:
+                logger.warning(f"Receipt polling failed: {str(e)}")
+                receipts = [None] * len(hashes)
+            now = time.monotonic()
+            for tx_hash, receipt in zip(hashes, receipts):
+                with self._lock:
+                    future, deadline = self._pending[tx_hash]
+                    if receipt is None and now < deadline:
+                        continue
+                    del self._pending[tx_hash]
+                if receipt is None:
+                    future.set_exception(
+                        TimeoutError(f"Transaction {tx_hash} is not mined in time")
+                    )
+                else:
+                    future.set_result(self._result(tx_hash, receipt))
+
+    def _fetch(self, hashes):
+        if not hasattr(self.w3.provider, "make_batch_request"):
+            return [self._get_receipt(tx_hash) for tx_hash in hashes]
+        receipts = []
+        for start in range(0, len(hashes), self.batch_size):
+            responses = self.w3.provider.make_batch_request(
+                [
+                    ("eth_getTransactionReceipt", [tx_hash])
+                    for tx_hash in hashes[start:start + self.batch_size]
+                ]
+            )
+            receipts.extend(response.get("result") for response in responses)
+        return receipts
+
+    def _get_receipt(self, tx_hash):
+        try:
+            return self.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    @staticmethod
+    def _result(tx_hash, receipt):
+        return {
+            "transactionHash": tx_hash,
+            "status": to_int(receipt["status"]),
+            "gasUsed": to_int(receipt["gasUsed"]),
+            "blockNumber": to_int(receipt["blockNumber"]),
+        }
@@ -0,0 +1,252 @@
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+
+from loguru import logger
+from web3.providers import BaseProvider
+
+from config.config import (
+    rpc_urls,
+    rpc_pool_window,
+    rpc_pool_min_samples,
+    rpc_pool_max_error_rate,
+    rpc_pool_eject_seconds,
+    rpc_rate_limits,
+)
+from services.batching_provider import BatchingHTTPProvider
+from services.rate_limiter import SEND_METHODS, RateLimitedProvider, is_rate_limited
+
+
+def pin(address, items, url=lambda item: item):
+    key = address.lower().encode()
+    return max(items, key=lambda item: zlib.crc32(key + url(item).encode()))
+
+
+class Endpoint:
+    __slots__ = ("url", "provider", "latencies", "errors", "requests", "ejected_until")
+
+    def __init__(self, url, provider, window):
+        self.url = url
+        self.provider = provider
+        self.latencies = deque(maxlen=window)
+        self.errors = deque(maxlen=window)
+        self.requests = 0
+        self.ejected_until = 0
+
+    @property
+    def latency(self):
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0
+
+    @property
+    def error_rate(self):
+        return sum(self.errors) / len(self.errors) if self.errors else 0
+
+    def __repr__(self):
+        return f"Endpoint({self.url})"
+
+
+class RPCPool(BaseProvider):
+    def __init__(
+        self,
+        urls=None,
+        window=rpc_pool_window,
+        min_samples=rpc_pool_min_samples,
+        max_error_rate=rpc_pool_max_error_rate,
+        eject_seconds=rpc_pool_eject_seconds,
+        rate_limits=rpc_rate_limits,
+        metrics=None,
+    ):
+        urls = [urls] if isinstance(urls, str) else urls or rpc_urls
+        if not urls:
+            raise ValueError("RPC pool needs at least one endpoint")
+        self.endpoints = []
+        for url in urls:
+            provider = BatchingHTTPProvider(url)
+            if rate_limits:
+                provider = RateLimitedProvider(provider, rate_limits)
+            self.endpoints.append(Endpoint(url, provider, window))
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.eject_seconds = eject_seconds
+        self.metrics = metrics
+        self.failovers = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def pinned(self, address):
+        previous = getattr(self._local, "account", None)
+        self._local.account = address
+        try:
+            yield self.endpoint_for(address)
+        finally:
+            self._local.account = previous
+
+    def endpoint_for(self, address, healthy=None):
+        return pin(address, healthy or self._healthy(), lambda endpoint: endpoint.url)
+
+    def fastest(self):
+        return min(self._healthy(), key=lambda endpoint: endpoint.latency)
+
+    def _healthy(self):
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                endpoint
+                for endpoint in self.endpoints
+                if endpoint.ejected_until and endpoint.ejected_until <= now
+            ]
+            for endpoint in expired:
+                endpoint.ejected_until = now + self.eject_seconds
+        for endpoint in expired:
+            self._probe(endpoint)
+        healthy = [endpoint for endpoint in self.endpoints if endpoint.ejected_until <= now]
+        if healthy:
+            return healthy
+        return [min(self.endpoints, key=lambda endpoint: endpoint.ejected_until)]
+
+    def _probe(self, endpoint):
+        started = time.monotonic()
+        try:
+            response = endpoint.provider.make_request("eth_blockNumber", [])
+            if "error" in response:
+                raise ValueError(response["error"])
+        except Exception as e:
+            logger.debug(f"RPC {endpoint.url} is still down: {str(e)}")
+            return
+        with self._lock:
+            endpoint.latencies.clear()
+            endpoint.errors.clear()
+            endpoint.latencies.append(time.monotonic() - started)
+            endpoint.errors.append(False)
+            endpoint.ejected_until = 0
+        logger.info(f"RPC {endpoint.url} is back in the pool")
+
+    def _record(self, endpoint, elapsed, failed, requests=1):
+        with self._lock:
+            endpoint.requests += requests
+            endpoint.errors.append(failed)
+            if not failed:
+                endpoint.latencies.append(elapsed)
+            if (
+                failed
+                and not endpoint.ejected_until
+                and len(endpoint.errors) >= self.min_samples
+                and endpoint.error_rate > self.max_error_rate
+            ):
+                endpoint.ejected_until = time.monotonic() + self.eject_seconds
+                logger.warning(
+                    f"RPC {endpoint.url} ejected for {self.eject_seconds}s "
+                    f"(error rate {endpoint.error_rate:.0%})"
+                )
+
+    def _account(self, method, params, account=None):
+        if account is not None:
+            return account
+        if method == "eth_getTransactionCount" and params:
+            return params[0]
+        if method in SEND_METHODS:
+            return getattr(self._local, "account", None)
+        return None
+
+    def _candidates(self, account):
+        first = self.endpoint_for(account) if account is not None else self.fastest()
+        others = sorted(
+            (endpoint for endpoint in self._healthy() if endpoint is not first),
+            key=lambda endpoint: endpoint.latency,
+        )
+        return [first] + others
+
+    def make_request(self, method, params):
+        account = self._account(method, params)
+        candidates = self._candidates(account)
+        if method in SEND_METHODS:
+            candidates = candidates[:1]
+        for attempt, endpoint in enumerate(candidates):
+            started = time.monotonic()
+            try:
+                response = endpoint.provider.make_request(method, params)
+            except Exception as e:
+                self._record(endpoint, time.monotonic() - started, True)
+                if attempt + 1 == len(candidates):
+                    raise
+                logger.debug(f"RPC {endpoint.url} failed on {method}, failing over: {str(e)}")
+                self.failovers += 1
+                continue
+            rate_limited = "error" in response and is_rate_limited(response["error"])
+            self._record(endpoint, time.monotonic() - started, rate_limited)
+            if not rate_limited or attempt + 1 == len(candidates):
+                return response
+            self.failovers += 1
+
+    def make_batch_request(self, calls, accounts=None):
+        if not calls:
+            return []
+        started = time.monotonic()
+        accounts = accounts or [None] * len(calls)
+        healthy = self._healthy()
+        fastest = min(healthy, key=lambda endpoint: endpoint.latency)
+        groups = {}
+        for index, ((method, params), account) in enumerate(zip(calls, accounts)):
+            account = self._account(method, params, account)
+            endpoint = fastest if account is None else self.endpoint_for(account, healthy)
+            groups.setdefault(endpoint, []).append(index)
+        responses = [None] * len(calls)
+        for endpoint, indexes in groups.items():
+            batch = [calls[index] for index in indexes]
+            for index, response in zip(indexes, self._send_batch(endpoint, batch)):
+                responses[index] = response
+        if self.metrics is not None:
+            self.metrics.observe_batch(calls, responses, time.monotonic() - started)
+        return responses
+
+    def _send_batch(self, endpoint, batch):
+        candidates = [endpoint]
+        if not any(method in SEND_METHODS for method, _ in batch):
+            candidates += [
+                other
+                for other in sorted(self._healthy(), key=lambda other: other.latency)
+                if other is not endpoint
+            ]
+        responses = None
+        for attempt, endpoint in enumerate(candidates):
+            started = time.monotonic()
+            try:
+                responses = endpoint.provider.make_batch_request(batch)
+            except Exception as e:
+                self._record(endpoint, time.monotonic() - started, True, len(batch))
+                logger.debug(f"RPC {endpoint.url} failed on a batch of {len(batch)}: {str(e)}")
+                responses = [
+                    {"jsonrpc": "2.0", "error": {"code": -32603, "message": str(e)}}
+                    for _ in batch
+                ]
+            else:
+                rate_limited = any(
+                    "error" in response and is_rate_limited(response["error"])
+                    for response in responses
+                )
+                self._record(endpoint, time.monotonic() - started, rate_limited, len(batch))
+                if not rate_limited:
+                    return responses
+            if attempt + 1 < len(candidates):
+                self.failovers += 1
+        return responses
+
+    def isConnected(self):
+        return any(endpoint.provider.isConnected() for endpoint in self.endpoints)
+
+    def stats(self):
+        now = time.monotonic()
+        stats = {}
+        for endpoint in self.endpoints:
+            stats[endpoint.url] = {
+                "requests": endpoint.requests,
+                "latency_ms": round(endpoint.latency * 1000, 1),
+                "error_rate": round(endpoint.error_rate, 3),
+                "ejected": endpoint.ejected_until > now,
+            }
+            if hasattr(endpoint.provider, "limiters"):
+                stats[endpoint.url]["rate_limits"] = endpoint.provider.stats()
+        return stats
@@ -0,0 +1,38 @@
+from loguru import logger
+
+
+class Settlement:
+    def __init__(self, receipts, nonce_manager, profiler, allowances):
+        self.receipts = receipts
+        self.nonce_manager = nonce_manager
+        self.profiler = profiler
+        self.allowances = allowances
+
+    def track(
+        self, address, order_hash, action=None, pool=None, gas_limit=None, approves=None, spends=None
+    ):
+        future = self.receipts.track(order_hash)
+        future.add_done_callback(
+            lambda future: self._settled(address, action, pool, gas_limit, approves, spends, future)
+        )
+        return future
+
+    def _settled(self, address, action, pool, gas_limit, approves, spends, future):
+        error = future.exception()
+        if isinstance(error, TimeoutError):
+            logger.warning(f"{error}, refetching nonce for {address}")
+            self.nonce_manager.resync(address)
+        if error is not None:
+            return
+        receipt = future.result()
+        if receipt["status"] == 1:
+            if action is not None:
+                self.profiler.record(action, pool, receipt["gasUsed"])
+            if approves is not None:
+                self.allowances.mark_approved(address, *approves)
+            return
+        if spends is not None:
+            self.allowances.forget(address, *spends)
+        if action is not None and gas_limit is not None and receipt["gasUsed"] >= gas_limit:
+            logger.warning(f"{action} ran out of gas, resetting its gas profile")
+            self.profiler.forget(action, pool)
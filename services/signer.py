@@ -0,0 +1,45 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from eth_account import Account
+
+from config.config import signer_processes, signer_chunk_size
+
+_accounts = {}
+
+
+def raw(signed_txn):
+    return bytes(signed_txn.rawTransaction), signed_txn.hash.hex()
+
+
+def sign(job):
+    private_key, txn = job
+    account = _accounts.get(private_key)
+    if account is None:
+        account = _accounts[private_key] = Account.from_key(private_key)
+    return raw(account.sign_transaction(txn))
+
+
+class BulkSigner:
+    def __init__(self, processes=signer_processes, chunk_size=signer_chunk_size):
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool = None
+        atexit.register(self.close)
+
+    def sign(self, jobs):
+        if self.processes <= 1 or len(jobs) <= self.chunk_size:
+            return [raw(wallet.signer.sign_transaction(txn)) for wallet, txn in jobs]
+        payload = [(wallet.private_key, txn) for wallet, txn in jobs]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return list(self._pool.map(sign, payload, chunksize=self.chunk_size))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
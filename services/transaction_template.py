@@ -0,0 +1,48 @@
+import random
+
+from config.config import gas_limits, gas_limit_jitter
+from services import encoder
+
+
+def gas_limit(action, limits=None, jitter=gas_limit_jitter):
+    limits = limits or gas_limits
+    limit = limits.get(action, limits["default"])
+    if jitter:
+        limit += random.randint(1, jitter)
+    return limit
+
+
+class TransactionTemplate:
+    def __init__(
+        self,
+        w3,
+        gas_oracle,
+        nonce_manager,
+        profiler=None,
+        limits=None,
+        jitter=gas_limit_jitter,
+        chain_id=None,
+    ):
+        self.chain_id = w3.eth.chain_id if chain_id is None else chain_id
+        self.gas_oracle = gas_oracle
+        self.nonce_manager = nonce_manager
+        self.profiler = profiler
+        self.limits = limits or gas_limits
+        self.jitter = jitter
+
+    def gas_limit(self, action, pool=None):
+        if self.profiler is not None:
+            limit = self.profiler.limit(action, pool)
+            if limit is not None:
+                return limit
+        return gas_limit(action, self.limits, self.jitter)
+
+    def build(self, action, address, to, data, value=0, pool=None):
+        gas = self.gas_limit(action, pool)
+        fees = self.gas_oracle.fees(action)
+        nonce = self.nonce_manager.get_nonce(address)
+        try:
+            return encoder.transaction(to, data, self.chain_id, nonce, gas, fees, value=value)
+        except Exception:
+            self.nonce_manager.resync(address)
+            raise
@@ -0,0 +1,52 @@
+from eth_account import Account
+
+from services.files import read_file_lines
+
+
+class Wallet:
+    __slots__ = ("index", "address", "signer")
+
+    def __init__(self, index, signer):
+        self.index = index
+        self.address = signer.address
+        self.signer = signer
+
+    @property
+    def private_key(self):
+        return self.signer.key.hex()
+
+    def __repr__(self):
+        return f"Wallet({self.index}, {self.address})"
+
+
+class WalletRegistry:
+    def __init__(self, private_keys):
+        self.wallets = []
+        self._by_address = {}
+        for private_key in private_keys:
+            private_key = private_key.strip()
+            if private_key:
+                self.add(private_key)
+
+    @classmethod
+    def from_file(cls, filepath):
+        return cls(read_file_lines(filepath))
+
+    def add(self, private_key):
+        wallet = Wallet(len(self.wallets), Account.from_key(private_key))
+        self.wallets.append(wallet)
+        self._by_address[wallet.address.lower()] = wallet
+        return wallet
+
+    def get(self, address):
+        return self._by_address.get(address.lower())
+
+    @property
+    def addresses(self):
+        return [wallet.address for wallet in self.wallets]
+
+    def __iter__(self):
+        return iter(self.wallets)
+
+    def __len__(self):
+        return len(self.wallets)